@@ -0,0 +1,95 @@
+"""
+Measure the file size and the save and load times of saved
+visualizations for every compression codec supported by
+``netwulf.save`` and ``netwulf.load``.
+
+Usage::
+
+    python benchmarks/compressed_files.py [number_of_nodes ...]
+
+For each number of nodes (default: 10000 and 100000), a Barabási-Albert
+graph with mean degree 4 is stylized with random positions the way the
+web app returns them and saved together with the graph.
+``zstd`` is only measured if the ``zstandard`` package is installed.
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+import networkx as nx
+
+import netwulf.io
+from netwulf.interactive import default_config
+
+
+CODECS = [
+    ('none', None),
+    ('gzip-1', {'method': 'gzip', 'compresslevel': 1}),
+    ('gzip-6', {'method': 'gzip', 'compresslevel': 6}),
+    ('gzip-9', {'method': 'gzip', 'compresslevel': 9}),
+    ('bz2-9', {'method': 'bz2', 'compresslevel': 9}),
+    ('xz-1', {'method': 'xz', 'preset': 1}),
+    ('xz-6', {'method': 'xz', 'preset': 6}),
+    ('zstd-3', {'method': 'zstd', 'level': 3}),
+    ('zstd-19', {'method': 'zstd', 'level': 19}),
+]
+
+
+def stylized_network(G, seed=1):
+    """Stylize a graph with random positions like the web app would."""
+    rng = random.Random(seed)
+    return {
+        'xlim': [0, 800],
+        'ylim': [0, 800],
+        'linkColor': '#7c7c7c',
+        'linkAlpha': 0.5,
+        'nodeStrokeColor': '#555555',
+        'nodeStrokeWidth': 0.5,
+        'nodes': [ {'id': u,
+                    'x': rng.uniform(0, 800),
+                    'y': rng.uniform(0, 800),
+                    'radius': rng.uniform(2, 10),
+                    'color': '#{:06x}'.format(rng.randrange(10)*0x111111),
+                   } for u in G.nodes() ],
+        'links': [ {'source': u, 'target': v, 'width': 1.0} for u, v in G.edges() ],
+    }
+
+
+def measure(path, props, config, G, compression):
+    start = time.perf_counter()
+    netwulf.io.save(path, props, config, G, compression=compression)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    netwulf.io.load(path)
+    load_time = time.perf_counter() - start
+
+    return os.path.getsize(path), save_time, load_time
+
+
+if __name__ == "__main__":
+
+    sizes = [ int(n) for n in sys.argv[1:] ] or [10000, 100000]
+
+    for N in sizes:
+        G = nx.barabasi_albert_graph(N, 2, seed=1)
+        props = stylized_network(G)
+
+        print("{} nodes, {} links".format(G.number_of_nodes(), G.number_of_edges()))
+        print("{:>8s} {:>10s} {:>7s} {:>9s} {:>9s}".format("codec", "size [MB]", "ratio", "save [s]", "load [s]"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'network.json')
+            uncompressed = None
+            for name, compression in CODECS:
+                if name.startswith('zstd') and netwulf.io.zstandard is None:
+                    continue
+                size, save_time, load_time = measure(path, props, default_config, G, compression)
+                if uncompressed is None:
+                    uncompressed = size
+                print("{:>8s} {:10.2f} {:7.2f} {:9.2f} {:9.2f}".format(
+                      name, size/1e6, uncompressed/size, save_time, load_time))
+        print()
@@ -0,0 +1,68 @@
+"""
+Measure the cold and warm start time of netwulf's visualization server,
+i.e. the time it takes from calling into netwulf until the web app's
+index page and the network data have been served.
+
+Usage::
+
+    python benchmarks/startup.py [number_of_warm_starts]
+
+The cold start is measured in a fresh interpreter and includes
+``import netwulf``, the warm starts are subsequent starts within
+the same interpreter.
+"""
+
+import sys
+import subprocess
+import time
+import threading
+import urllib.request
+import urllib.error
+
+
+PAYLOADS = {'/data/network.json': b'{"nodes":[{"id":0},{"id":1}],"links":[{"source":0,"target":1}]}'}
+
+
+def start_and_fetch(payloads=PAYLOADS):
+    """Start a server, fetch the index page and the data, stop the server."""
+    from netwulf.interactive import NetwulfHTTPServer, NetwulfHTTPRequestHandler
+
+    server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [], payloads=payloads)
+    thread = threading.Thread(None, server.run)
+    thread.start()
+
+    url = "http://127.0.0.1:{}/".format(server.server_address[1])
+    for route in ['', 'data/network.json']:
+        try:
+            urllib.request.urlopen(url + route).read()
+        except urllib.error.HTTPError:
+            # the web app is not available if the js-submodule isn't checked out
+            pass
+
+    server.end_requested = True
+    thread.join()
+    server.stop_this()
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        start = time.perf_counter()
+        start_and_fetch()
+        print(time.perf_counter() - start)
+        sys.exit(0)
+
+    n_warm = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    cold = float(subprocess.check_output([sys.executable, __file__, '--child']))
+
+    warm = []
+    start_and_fetch()
+    for _ in range(n_warm):
+        start = time.perf_counter()
+        start_and_fetch()
+        warm.append(time.perf_counter() - start)
+
+    print("cold start: {:.1f} ms".format(cold*1000))
+    print("warm start: {:.1f} ms (min {:.1f} ms over {} runs)".format(
+          sum(warm)/len(warm)*1000, min(warm)*1000, n_warm))
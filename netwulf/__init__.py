@@ -8,3 +8,4 @@ from .metadata import __version__
 from .interactive import *
 from .tools import *
 from .io import *
+from .layout import *
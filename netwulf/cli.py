@@ -0,0 +1,218 @@
+"""
+Command line interface of netwulf.
+
+Render saved visualizations or graph files to images in parallel::
+
+    netwulf render -j 8 -o figures/ *.json
+"""
+
+import sys
+import time
+import argparse
+import pathlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import simplejson as json
+
+# file extensions of graph files that can be read with networkx
+_graph_readers = {
+    '.graphml': 'read_graphml',
+    '.gml': 'read_gml',
+    '.edgelist': 'read_edgelist',
+    '.edges': 'read_edgelist',
+}
+
+# the figure that is reused by all renderings of a worker process
+_figure = None
+
+def _init_worker():
+    """Set up the figure once per worker process, independent of pyplot's backend."""
+    from matplotlib.figure import Figure
+
+    global _figure
+    _figure = Figure()
+
+def _load_network_properties(path, layout_config=None):
+    """
+    Get the network properties of a file, which is either a file written
+    by :mod:`netwulf.io.save` or a graph file which is laid out
+    with :mod:`netwulf.layout.force_layout`.
+    """
+    import networkx as nx
+    from netwulf.io import _node_link_graph
+    from netwulf.layout import force_layout
+
+    path = pathlib.Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == '.json':
+        with open(str(path), 'r') as f:
+            data = json.load(f)
+        if 'stylized_network' in data:
+            return data['stylized_network']
+        G = _node_link_graph(data)
+    elif suffix in _graph_readers:
+        G = getattr(nx, _graph_readers[suffix])(str(path))
+    else:
+        raise ValueError("Unknown file type: " + str(path))
+
+    return force_layout(G, config=layout_config)[0]
+
+def _render_file(path, output_dir, fmt, dpi, figsize, layout_config):
+    """
+    Render a single file. Returns the path, the output path,
+    an error report (or ``None``) and the duration in seconds.
+    """
+    from netwulf.tools import draw_netwulf
+
+    start = time.perf_counter()
+    output = pathlib.Path(output_dir) / (pathlib.Path(path).stem + '.' + fmt)
+    try:
+        props = _load_network_properties(path, layout_config)
+
+        fig = _figure
+        fig.clf()
+        fig.set_size_inches(figsize, figsize)
+        ax = fig.add_axes([0, 0, 1, 1])
+        draw_netwulf(props, fig=fig, ax=ax)
+        fig.savefig(str(output), dpi=dpi)
+        error = None
+    except Exception as e:
+        error = "{}: {}\n{}".format(type(e).__name__, e, traceback.format_exc())
+
+    return str(path), str(output), error, time.perf_counter() - start
+
+def render(files,
+           output_dir='.',
+           fmt='png',
+           jobs=1,
+           dpi=150,
+           figsize=None,
+           layout_config=None,
+           verbose=True,
+           ):
+    """
+    Render many saved visualizations or graph files to images.
+
+    Parameters
+    ----------
+    files : list of str
+        Files written by :mod:`netwulf.io.save` or graph files
+        (node-link json, ``.graphml``, ``.gml``, ``.edgelist``),
+        which are laid out with :mod:`netwulf.layout.force_layout`.
+    output_dir : str, default : '.'
+        Directory to which the images are written.
+    fmt : str, default : 'png'
+        Image format, anything matplotlib can save.
+    jobs : int, default : 1
+        Number of worker processes.
+    dpi : int, default : 150
+        Resolution of raster images.
+    figsize : float, default : None
+        Side length of the figures in inches. If ``None``, it's taken
+        as the minimum of ``matplotlib.rcParams['figure.figsize']``.
+    layout_config : dict, default : None
+        Config for laying out graph files.
+    verbose : bool, default : True
+        Print a line for every file and a summary.
+
+    Returns
+    -------
+    results : list of tuple
+        ``(file, output, error, seconds)`` for every file,
+        where ``error`` is ``None`` if rendering succeeded.
+    """
+
+    if figsize is None:
+        import matplotlib as mpl
+        figsize = min(mpl.rcParams['figure.figsize'])
+
+    pathlib.Path(output_dir).mkdir(parents=True, exist_ok=True)
+    args = (output_dir, fmt, dpi, figsize, layout_config)
+
+    def report(result):
+        path, output, error, seconds = result
+        if verbose:
+            if error is None:
+                print("ok      {} -> {} ({:.2f}s)".format(path, output, seconds))
+            else:
+                print("FAILED  {} ({:.2f}s)\n{}".format(path, seconds, error), file=sys.stderr)
+
+    start = time.perf_counter()
+    results = []
+    if jobs == 1:
+        _init_worker()
+        for path in files:
+            results.append(_render_file(path, *args))
+            report(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            futures = [ pool.submit(_render_file, path, *args) for path in files ]
+            for future in as_completed(futures):
+                results.append(future.result())
+                report(results[-1])
+    duration = time.perf_counter() - start
+
+    if verbose:
+        failed = sum(error is not None for _, _, error, _ in results)
+        print("rendered {} of {} files in {:.2f}s ({:.2f} files/s, {} worker{})".format(
+              len(results) - failed, len(results), duration,
+              len(results) / duration if duration > 0 else float('inf'),
+              jobs, '' if jobs == 1 else 's'))
+
+    return results
+
+def main(argv=None):
+    """Entry point of the ``netwulf`` console script."""
+    parser = argparse.ArgumentParser(prog='netwulf', description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest='command')
+
+    render_parser = subparsers.add_parser('render',
+                                          help='render saved visualizations or graph files to images')
+    render_parser.add_argument('files', nargs='+',
+                               help='files written by netwulf.save or graph files')
+    render_parser.add_argument('-o', '--output-dir', default='.',
+                               help='directory to which the images are written')
+    render_parser.add_argument('-f', '--format', default='png', dest='fmt',
+                               help='image format (png, pdf, svg, ...)')
+    render_parser.add_argument('-j', '--jobs', type=int, default=1,
+                               help='number of worker processes')
+    render_parser.add_argument('--dpi', type=int, default=150,
+                               help='resolution of raster images')
+    render_parser.add_argument('--figsize', type=float, default=None,
+                               help='side length of the figures in inches')
+    render_parser.add_argument('--config', default=None,
+                               help='json file with the config used to lay out graph files')
+    render_parser.add_argument('-q', '--quiet', action='store_true',
+                               help='only report errors')
+
+    args = parser.parse_args(argv)
+    if args.command != 'render':
+        parser.print_help()
+        return 2
+
+    layout_config = None
+    if args.config is not None:
+        with open(args.config, 'r') as f:
+            layout_config = json.load(f)
+
+    results = render(args.files,
+                     output_dir=args.output_dir,
+                     fmt=args.fmt,
+                     jobs=max(args.jobs, 1),
+                     dpi=args.dpi,
+                     figsize=args.figsize,
+                     layout_config=layout_config,
+                     verbose=not args.quiet,
+                     )
+
+    if args.quiet:
+        for path, _, error, _ in results:
+            if error is not None:
+                print("FAILED  {}\n{}".format(path, error), file=sys.stderr)
+
+    return 0 if all(error is None for _, _, error, _ in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
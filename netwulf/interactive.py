@@ -8,30 +8,34 @@ from __future__ import print_function
 import os
 import sys
 import simplejson as json
-from distutils.dir_util import copy_tree
 import base64
 import http.server
+import socketserver
 import webbrowser
 import time
 import threading
+import uuid
+from concurrent.futures import Future
 from copy import deepcopy
 import shutil
-from io import BytesIO
 import pathlib
+import urllib.parse
+import zlib
 
-import numpy
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
+import numpy as np
 import networkx as nx
 import netwulf as wulf
+from netwulf.io import _json_default, iter_node_link_json, iter_columnar_network
+from netwulf.tools import get_thresholded_network, get_coarsened_network, get_temporal_network
 
 netwulf_user_folder = pathlib.Path('~/.netwulf/').expanduser()
 html_source_path = (pathlib.Path(wulf.__path__[0]) / 'js').expanduser()
 
-def _json_default(o):
-    if isinstance(o, numpy.int64): return int(o)
-    elif isinstance(o, numpy.float64): return float(o)
-    raise TypeError
-
 def mkdirp_customdir(directory=None):
     """simulate `mkdir -p` functionality"""
     if directory is None:
@@ -45,16 +49,103 @@ def mkdirp_customdir(directory=None):
     directory.mkdir(parents=True, exist_ok=True)
 
 def prepare_visualization_directory():
-    """Move all files from the netwulf/js directory to ~/.netwulf"""
+    """
+    Copy all files from the netwulf/js directory to ~/.netwulf.
+    This is not necessary for :mod:`netwulf.interactive.visualize`,
+    which serves the web app directly from the package directory.
+    """
     src = html_source_path
     dst = netwulf_user_folder
 
-    # always copy source files to the subdirectory
-    copy_tree(str(src), str(dst))
+    for dirpath, dirnames, filenames in os.walk(str(src)):
+        target = dst / pathlib.Path(dirpath).relative_to(src)
+        mkdirp_customdir(target)
+        for filename in filenames:
+            shutil.copy2(os.path.join(dirpath, filename), str(target / filename))
+
+# content encodings in order of preference
+_content_encodings = (['br'] if brotli is not None else []) + ['gzip']
+
+# mime types of assets that are worth compressing
+_compressible_types = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# compressed static assets, keyed by (path, mtime, size, encoding)
+_compressed_assets = {}
+
+def _compressor(encoding, fast=False):
+    """
+    Get the ``(compress, flush)`` functions of a streaming compressor
+    for an HTTP content encoding. Use ``fast = True`` for data that is
+    compressed on the fly.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=4 if fast else 11)
+        return compressor.process, compressor.finish
+    elif encoding == 'gzip':
+        compressor = zlib.compressobj(1 if fast else 9, zlib.DEFLATED, 31)
+        return compressor.compress, compressor.flush
+    raise ValueError("Unknown content encoding: " + str(encoding))
+
+def _iter_compressed(chunks, encoding):
+    """Compress a stream of chunks of bytes."""
+    compress, flush = _compressor(encoding, fast=True)
+    for chunk in chunks:
+        yield compress(chunk)
+    yield flush()
+
+def _compressed_asset(path, encoding):
+    """Compress a static asset once and return the cached result from then on."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size, encoding)
+    if key not in _compressed_assets:
+        compress, flush = _compressor(encoding)
+        with open(path, 'rb') as f:
+            _compressed_assets[key] = compress(f.read()) + flush()
+    return _compressed_assets[key]
+
+class _UpdateChannel(object):
+    """
+    Log of the changes pushed to a running visualization, which are
+    streamed to the web app as server-sent events. Every listener
+    receives all events it hasn't seen yet, in order.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def push(self, event):
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
 
-class NetwulfHTTPServer(http.server.HTTPServer):
+    def wait(self, seen, timeout):
+        """Wait until there are more than ``seen`` events or the channel is closed."""
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.events) > seen or self.closed, timeout)
+            return self.events[seen:], self.closed
+
+
+class NetwulfHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
     """Custom netwulf server class adapted from 
-    https://stackoverflow.com/questions/268629/how-to-stop-basehttpserver-serve-forever-in-a-basehttprequesthandler-subclass """
+    https://stackoverflow.com/questions/268629/how-to-stop-basehttpserver-serve-forever-in-a-basehttprequesthandler-subclass
+
+    Every request is handled in its own thread such that the browser's
+    parallel requests (html, d3 libraries, data, config) don't
+    queue up behind each other."""
+
+    # request threads must not keep the interpreter alive
+    daemon_threads = True
+
+    # wake up from waiting for a request every `timeout` seconds
+    # to check whether the end was requested
+    timeout = 0.1
 
     # The handler will write in this attribute
     posted_network_properties = None
@@ -63,10 +154,18 @@ class NetwulfHTTPServer(http.server.HTTPServer):
  
     end_requested = False
 
-    def __init__(self, server_address, handler, subjson, verbose=False):
+    def __init__(self, server_address, handler, subjson, verbose=False, payloads=None):
         http.server.HTTPServer.__init__(self, server_address, handler)
         self.subjson = subjson
         self.verbose = verbose
+        # maps routes to the bytes which are served from memory
+        if payloads is None:
+            payloads = {}
+        self.payloads = payloads
+        # maps ids of visualizations which wait for a POST to their futures
+        self.visualizations = {}
+        # maps ids of visualizations to the channels of their live updates
+        self.update_channels = {}
 
     def run(self):
         try:
@@ -75,7 +174,7 @@ class NetwulfHTTPServer(http.server.HTTPServer):
             pass
 
     def serve_forever(self):
-        """Handle one request at a time until doomsday."""
+        """Handle requests concurrently until the end is requested."""
         while not self.end_requested:
             self.handle_request()
         if self.verbose:
@@ -96,6 +195,12 @@ class NetwulfHTTPServer(http.server.HTTPServer):
         if self.verbose:
             print('deleted all files')
 
+    def resolve_visualization(self, vis_id, network_properties, config):
+        """Set the result of the future belonging to visualization ``vis_id``."""
+        future = self.visualizations.pop(vis_id, None)
+        if future is not None and future.set_running_or_notify_cancel():
+            future.set_result((network_properties, config))
+
 
 class NetwulfHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """A custom handler class adapted from
@@ -104,28 +209,192 @@ class NetwulfHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     https://blog.anvileight.com/posts/simple-python-http-server/#do-post
     """
 
+    # necessary for chunked transfer encoding
+    protocol_version = 'HTTP/1.1'
+
+    # maximum size of an image posted to the `/image` route in bytes
+    max_image_size = 2**28
+
+    # seconds after which a comment is sent to keep an idle update stream open
+    heartbeat_interval = 15
+
+    def translate_path(self, path):
+        # serve the web app's files directly from the package directory
+        # instead of the current working directory
+        path = http.server.SimpleHTTPRequestHandler.translate_path(self, path)
+        served_directory = getattr(self, 'directory', os.getcwd())
+        return os.path.join(str(html_source_path), os.path.relpath(path, served_directory))
+
+    def _get_content_encoding(self):
+        """Negotiate the content encoding with the client's ``Accept-Encoding`` header."""
+        accepted = {}
+        for item in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = item.partition(';')
+            params = params.replace(' ', '')
+            try:
+                quality = float(params[2:]) if params.startswith('q=') else 1.0
+            except ValueError:
+                quality = 0.0
+            accepted[name.strip().lower()] = quality
+
+        for encoding in _content_encodings:
+            if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+                return encoding
+        return None
+
+    def do_GET(self):
+        encoding = self._get_content_encoding()
+
+        # serve network and config from memory if this route was registered
+        route = urllib.parse.urlsplit(self.path).path
+        if route == '/updates':
+            return self._stream_updates()
+        payload = self.server.payloads.get(route)
+        if payload is None:
+            path = self.translate_path(self.path)
+            content_type = self.guess_type(path)
+            if encoding is None or not os.path.isfile(path) or not content_type.startswith(_compressible_types):
+                return http.server.SimpleHTTPRequestHandler.do_GET(self)
+
+            body = _compressed_asset(path, encoding)
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(route))
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+
+        # a callable payload produces the data as a stream of chunks
+        if callable(payload):
+            chunks = payload()
+            if encoding is not None:
+                chunks = _iter_compressed(chunks, encoding)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in chunks:
+                if chunk:
+                    self.wfile.write('{:x}\r\n'.format(len(chunk)).encode() + chunk + b'\r\n')
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            if encoding is not None:
+                compress, flush = _compressor(encoding, fast=True)
+                payload = compress(payload) + flush()
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def _stream_updates(self):
+        """
+        Stream the changes pushed to the visualization given by the
+        ``id`` in the query as server-sent events. Events are numbered,
+        such that a reconnecting client (which sends ``Last-Event-ID``)
+        only receives the events it hasn't seen yet.
+        """
+        channel = self.server.update_channels.get(self._get_visualization_id())
+        if channel is None:
+            self.send_error(404, "No updates for this visualization")
+            return
+
+        try:
+            seen = int(self.headers.get('Last-Event-ID', 0))
+        except ValueError:
+            seen = 0
+
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+
+        idle = 0.0
+        try:
+            while not self.server.end_requested:
+                events, closed = channel.wait(seen, self.server.timeout)
+                if events:
+                    message = b''.join( 'id: {}\ndata: '.format(seen+i+1).encode() + event + b'\n\n'
+                                        for i, event in enumerate(events) )
+                    seen += len(events)
+                    idle = 0.0
+                elif closed:
+                    break
+                else:
+                    idle += self.server.timeout
+                    if idle < self.heartbeat_interval:
+                        continue
+                    message = b': heartbeat\n\n'
+                    idle = 0.0
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # the browser window was closed
+            pass
+
+    def _respond(self, message):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(message)))
+        self.end_headers()
+        self.wfile.write(message)
+
+    def _get_visualization_id(self):
+        """
+        Find the id of the visualization this request belongs to,
+        either in the request's query or in the query of the web app's
+        page from which it was sent.
+        """
+        for url in [self.path, self.headers.get('Referer', '')]:
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+            if 'id' in query:
+                return query['id'][0]
+        return None
+
+    def _receive_image(self, content_length):
+        """
+        Read a PNG which was posted as raw bytes to the ``/image`` route.
+        The image is read with a single buffer of the announced size.
+        """
+        if content_length > self.max_image_size:
+            self.close_connection = True
+            self.send_error(413, "Image larger than {} bytes".format(self.max_image_size))
+            return
+
+        self.server.posted_image_base64 = self.rfile.read(content_length)
+        self._respond(b'Successful POST request.')
+
+        if self.server.verbose:
+            print("Successfully posted image to Python!")
+
     def do_POST(self):
         content_length = int(self.headers['Content-Length'])
+        vis_id = self._get_visualization_id()
 
-        # an empty POST means the server should be stopped
+        # the web app posts the image separately from the network properties
+        if urllib.parse.urlsplit(self.path).path == '/image':
+            return self._receive_image(content_length)
+
+        # an empty POST means the server should be stopped,
+        # or, in a session, that the visualization was closed
         if content_length == 0:
             try:
                 body = self.rfile.read(content_length)
-                self.send_response(200)
-                self.end_headers()
-                response = BytesIO()
-                response.write(b'Closing now.')
-                self.wfile.write(response.getvalue())
+                self._respond(b'Closing now.')
             except: #this should actually catch a ConnectionError for windows or firefox
                 pass
-            self.server.end_requested = True
+            if vis_id in self.server.visualizations:
+                self.server.resolve_visualization(vis_id, None, None)
+            else:
+                self.server.end_requested = True
         else:
             body = self.rfile.read(content_length)
-            self.send_response(200)
-            self.end_headers()
-            response = BytesIO()
-            response.write(b'Successful POST request.')
-            self.wfile.write(response.getvalue())
+            self._respond(b'Successful POST request.')
 
             # Save this posted data to the server object so it can be retrieved later on
             if self.server.verbose:
@@ -133,8 +402,13 @@ class NetwulfHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             received_data = json.loads(body)
             self.server.posted_network_properties = received_data['network']
             self.server.posted_config = received_data['config']
-            img = received_data['image'].split(',')[1]
-            self.server.posted_image_base64 = base64.decodebytes(img.encode())
+            # older versions of the web app send the image as a data URL
+            if 'image' in received_data:
+                img = received_data['image'].split(',')[1]
+                self.server.posted_image_base64 = base64.decodebytes(img.encode())
+            self.server.resolve_visualization(vis_id,
+                                              self.server.posted_network_properties,
+                                              self.server.posted_config)
 
 
     def log_message(self, format, *args):
@@ -143,6 +417,9 @@ class NetwulfHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
 
 
 
+# number of supernodes up to which a network is coarsened by `visualize(..., coarsen=True)`
+_default_max_supernodes = 1000
+
 default_config = {
     # Input/output
     'zoom': 1,
@@ -175,17 +452,316 @@ default_config = {
 }
 
 
+def _prepare_payloads(network, config, vis_id, debug=False, verbose=False, binary=False, apply_thresholds=False,
+                      coarsen=False, frames=None):
+    """
+    Serialize the network and the config. Returns a dictionary which maps
+    routes to the serialized data and the query which tells the web app
+    where to find it.
+    """
+
+    this_config = deepcopy(default_config)
+    if config is not None:
+        this_config.update(config)
+
+    filename = "network_" + vis_id + ".json"
+    configname = "config_" + vis_id + ".json"
+
+    # frames refer to the nodes and links of the network by index
+    if frames is not None and (coarsen or apply_thresholds):
+        raise ValueError("Temporal networks can't be coarsened or thresholded.")
+
+    supernode_payloads = {}
+    if type(network) in [nx.Graph, nx.DiGraph, nx.MultiDiGraph] and coarsen:
+        # show the network of supernodes, whose subgraphs are fetched on demand
+        coarsen_kwargs = {'max_supernodes': _default_max_supernodes}
+        if isinstance(coarsen, dict):
+            coarsen_kwargs.update(coarsen)
+        coarse, members = get_coarsened_network(network, **coarsen_kwargs)
+        coarse.graph.update(network.graph)
+        for k, supernode_members in enumerate(members):
+            supernodename = "supernode_" + vis_id + "_" + str(k) + ".json"
+            def supernode_payload(subgraph=network.subgraph(supernode_members)):
+                return iter_node_link_json(subgraph)
+            supernode_payloads['/data/' + supernodename] = supernode_payload
+            coarse.nodes[k]['subgraph'] = 'data/' + supernodename
+        network = coarse
+
+    withheld = None
+    if type(network) in [nx.Graph, nx.DiGraph, nx.MultiDiGraph] and apply_thresholds:
+        # only send what the web app is going to draw
+        full_network = network
+        network, withheld = get_thresholded_network(full_network, this_config)
+
+    if type(network) in [nx.Graph, nx.DiGraph, nx.MultiDiGraph]:
+        # the network is streamed to the web app on request
+        def network_payload(network=network):
+            return iter_node_link_json(network, flatten_graph_attributes=True)
+    elif type(network) == dict:
+        network_payload = json.dumps(network, iterable_as_array=True, default=_json_default).encode()
+    else:
+        raise TypeError("Netwulf only supports `nx.Graph`, `nx.DiGraph`, `nx.MultiDiGraph`, or `dict`.")
+
+    payloads = {
+        '/data/' + filename: network_payload,
+        '/data/' + configname: json.dumps(this_config, default=_json_default).encode(),
+    }
+    payloads.update(supernode_payloads)
+    query = "data=data/" + filename + "&config=data/" + configname
+
+    # the web app can fetch the links (and nodes) that didn't pass
+    # the thresholds when they're widened interactively
+    if withheld is not None:
+        withheldname = "withheld_" + vis_id + ".json"
+        def withheld_payload(withheld=withheld, shown=network, full_network=full_network):
+            nodes = ( (node, data) for node, data in full_network.nodes(data=True) if node not in shown )
+            return iter_node_link_json(withheld, nodes=nodes)
+        payloads['/data/' + withheldname] = withheld_payload
+        query += "&withheld=data/" + withheldname
+
+    if frames is not None:
+        framesname = "frames_" + vis_id + ".json"
+        payloads['/data/' + framesname] = json.dumps(frames, iterable_as_array=True, default=_json_default).encode()
+        query += "&frames=data/" + framesname
+
+    # the json-route stays available as a fallback for the binary format
+    if binary and callable(network_payload):
+        binaryname = "network_" + vis_id + ".bin"
+        def binary_payload(network=network):
+            return iter_columnar_network(network)
+        payloads['/data/' + binaryname] = binary_payload
+        query += "&binary=data/" + binaryname
+
+    if debug:
+        web_dir = netwulf_user_folder
+        mkdirp_customdir(web_dir)
+        for route, payload in payloads.items():
+            filepath = web_dir / pathlib.PurePosixPath(route).name
+            with open(str(filepath), 'wb') as f:
+                for chunk in (payload() if callable(payload) else [payload]):
+                    f.write(chunk)
+            if verbose:
+                print("wrote", str(filepath))
+
+    return payloads, query
+
+
+class NetwulfSession(object):
+    """
+    A long-lived visualization server which is started once
+    and reused for many visualizations on the same port.
+
+    Parameters
+    ----------
+    port : int, default : 9853
+        The port at which to run the server locally.
+    verbose : bool, default : False
+        Be chatty.
+
+    Example
+    -------
+        >>> session = NetwulfSession().start()
+        >>> future = session.visualize(G)
+        >>> props, config = future.result()
+        >>> session.stop()
+    """
+
+    def __init__(self, port=9853, verbose=False):
+        self.port = port
+        self.verbose = verbose
+        self.server = None
+        self.thread = None
+
+    @property
+    def running(self):
+        return self.server is not None
+
+    def start(self):
+        """Start the server in a background thread."""
+        if self.running:
+            return self
+
+        if self.verbose:
+            print("starting server here ...", str(html_source_path))
+
+        self.server = NetwulfHTTPServer(("127.0.0.1", self.port),
+                                        NetwulfHTTPRequestHandler,
+                                        [],
+                                        verbose=self.verbose,
+                                        )
+        self.thread = threading.Thread(None, self.server.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop the server and cancel all visualizations that are still waiting for a POST."""
+        if not self.running:
+            return
+
+        if self.verbose:
+            print('stopping server ...')
+
+        self.server.end_requested = True
+        self.thread.join()
+        self.server.stop_this()
+
+        for future in list(self.server.visualizations.values()):
+            future.cancel()
+
+        self.server = None
+        self.thread = None
+
+    def visualize(self, network, config=None, is_test=False, debug=False, binary=False, apply_thresholds=False,
+                  coarsen=False, frames=None):
+        """
+        Open a new visualization of a network in the browser without
+        waiting for it. Takes the same arguments as
+        :mod:`netwulf.interactive.visualize`.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Resolves to ``(network_properties, config)`` as soon as the
+            web app posts the visualization to Python or to ``(None, None)``
+            if the browser window is closed before that.
+        """
+        self.start()
+
+        vis_id = uuid.uuid4().hex
+        payloads, query = _prepare_payloads(network, config, vis_id,
+                                            debug=debug, verbose=self.verbose, binary=binary,
+                                            apply_thresholds=apply_thresholds, coarsen=coarsen, frames=frames)
+
+        future = Future()
+        channel = _UpdateChannel()
+
+        # forget the served data as soon as the visualization is done
+        def _forget_payloads(_future, server=self.server):
+            for route in payloads:
+                server.payloads.pop(route, None)
+            server.update_channels.pop(vis_id, None)
+            channel.close()
+        future.add_done_callback(_forget_payloads)
+
+        self.server.payloads.update(payloads)
+        self.server.update_channels[vis_id] = channel
+        self.server.visualizations[vis_id] = future
+
+        url = "http://localhost:"+str(self.port)+"/?" + query + "&updates=updates&id=" + vis_id
+        if is_test:
+            url += "&pytest"
+        webbrowser.open(url)
+
+        return future
+
+    def update(self, visualization, nodes=None, links=None, removed_nodes=None, removed_links=None):
+        """
+        Push changes of the network to a running visualization, which
+        the web app applies to its simulation, keeping the positions
+        of the nodes that were already there.
+
+        Parameters
+        ----------
+        visualization : concurrent.futures.Future
+            The future returned by :mod:`netwulf.interactive.NetwulfSession.visualize`.
+        nodes : iterable, default : None
+            Nodes that are added or whose attributes changed, as node ids
+            or as ``(node, attributes)``-tuples (like ``G.nodes(data=True)``).
+        links : iterable, default : None
+            Links that are added or whose attributes changed, as
+            ``(u, v)``- or ``(u, v, attributes)``-tuples (like ``G.edges(data=True)``).
+        removed_nodes : iterable, default : None
+            Ids of the nodes to remove, together with their links.
+        removed_links : iterable, default : None
+            Links to remove as ``(u, v)``-tuples.
+
+        Example
+        -------
+            >>> future = session.visualize(G)
+            >>> G.add_edge(0, 'new', weight=2)
+            >>> session.update(future, nodes=['new'], links=[(0, 'new', {'weight': 2})])
+        """
+        vis_id = next((vis_id for vis_id, future in list(self.server.visualizations.items())
+                              if future is visualization), None) if self.running else None
+        channel = self.server.update_channels.get(vis_id) if vis_id is not None else None
+        if channel is None:
+            raise ValueError("This visualization is not running in this session.")
+
+        def node_dict(node):
+            if isinstance(node, tuple) and len(node) == 2 and isinstance(node[1], dict):
+                return dict(node[1], id=node[0])
+            return {'id': node}
+
+        def link_dict(link):
+            data = link[2] if len(link) > 2 else {}
+            return dict(data, source=link[0], target=link[1])
+
+        delta = {}
+        if nodes is not None:
+            delta['nodes'] = [ node_dict(node) for node in nodes ]
+        if links is not None:
+            delta['links'] = [ link_dict(link) for link in links ]
+        if removed_nodes is not None:
+            delta['removed_nodes'] = list(removed_nodes)
+        if removed_links is not None:
+            delta['removed_links'] = [ {'source': u, 'target': v} for u, v, *_ in removed_links ]
+
+        channel.push(json.dumps(delta, iterable_as_array=True, default=_json_default).encode())
+
+
+_session = None
+
+def start_session(port=9853, verbose=False):
+    """
+    Start a persistent visualization server which is reused by
+    all subsequent calls of :mod:`netwulf.interactive.visualize`
+    until :mod:`netwulf.interactive.stop_session` is called.
+
+    Parameters
+    ----------
+    port : int, default : 9853
+        The port at which to run the server locally.
+    verbose : bool, default : False
+        Be chatty.
+
+    Returns
+    -------
+    session : NetwulfSession
+        The running session. If a session is already running,
+        this one is returned.
+    """
+    global _session
+    if _session is None:
+        _session = NetwulfSession(port=port, verbose=verbose).start()
+    return _session
+
+def stop_session():
+    """Stop the persistent visualization server, if there's one running."""
+    global _session
+    if _session is not None:
+        _session.stop()
+        _session = None
+
+
 def visualize(network,
               port=9853,
               verbose=False,
               config=None,
               plot_in_cell_below=True,
               is_test=False,
+              debug=False,
+              block=True,
+              binary=False,
+              apply_thresholds=False,
+              coarsen=False,
+              frames=None,
               ):
     """
     Visualize a network interactively using Ulf Aslak's d3 web app.
-    Saves the network as json, saves the passed config and runs 
-    a local HTTP server which then runs the web app.
+    Serializes the network and the passed config to json and runs
+    a local HTTP server which serves both from memory to the web app.
     
     Parameters
     ----------
@@ -239,6 +815,43 @@ def visualize(network,
     is_test : bool, default : False
         If ``True``, the interactive environment will post
         its visualization to Python automatically after 5 seconds.
+    debug : bool, default : False
+        If ``True``, additionally write the served network and config
+        json-files to ``~/.netwulf/`` where they are kept for inspection.
+    block : bool, default : True
+        If ``False``, don't wait for the visualization to be posted
+        back to Python, but return a future instead. In this case,
+        and whenever a session was started with
+        :mod:`netwulf.interactive.start_session`, the visualization
+        is served by a persistent server that is reused by subsequent calls.
+    binary : bool, default : False
+        If ``True`` and ``network`` is a networkx graph, additionally serve
+        the network in netwulf's binary columnar format
+        (see :mod:`netwulf.io.iter_columnar_network`), which the web app
+        prefers over json if it's able to read it.
+    apply_thresholds : bool, default : False
+        If ``True`` and ``network`` is a networkx graph, apply the config's
+        ``'min_link_weight_percentile'``, ``'max_link_weight_percentile'``
+        and ``'display_singleton_nodes'`` in Python
+        (see :mod:`netwulf.tools.get_thresholded_network`), such that only
+        the links and nodes that are drawn are sent to the browser.
+        The withheld links and nodes are served, too, such that the web app
+        can fetch them when the thresholds are widened interactively.
+    coarsen : bool or dict, default : False
+        If ``True`` and ``network`` is a networkx graph, show a coarse network
+        of supernodes instead (see :mod:`netwulf.tools.get_coarsened_network`),
+        which aggregates nodes by their ``'group'`` attribute or, if it's
+        missing, by label propagation into at most 1000 supernodes.
+        Pass a dict to set the arguments of ``get_coarsened_network``.
+        Each supernode has the attribute ``'subgraph'`` with the route
+        from which the web app can fetch the subgraph of its members
+        when the supernode is expanded.
+    frames : list of dict, default : None
+        Frames of a temporal network whose union is ``network``, as
+        returned by :mod:`netwulf.tools.get_temporal_network`, through
+        which the web app can scrub. Use
+        :mod:`netwulf.interactive.visualize_temporal` to visualize
+        a sequence of snapshots.
 
     Returns
     -------
@@ -248,60 +861,77 @@ def visualize(network,
     config : dict
         contains all configurational values of the interactive
         visualization
+
+    If ``block = False``, a ``concurrent.futures.Future`` which
+    resolves to ``(network_properties, config)`` is returned instead.
     """
 
-    this_config = deepcopy(default_config)
-    if config is not None:
-        this_config.update(config)
+    if not block or _session is not None:
+        session = start_session(port=port, verbose=verbose)
+        future = session.visualize(network, config=config, is_test=is_test, debug=debug, binary=binary,
+                                   apply_thresholds=apply_thresholds, coarsen=coarsen, frames=frames)
+        if not block:
+            return future
 
-    path = netwulf_user_folder
-    mkdirp_customdir()
-    web_dir = pathlib.Path(path)
-
-    # copy the html and js files for the visualizations
-    prepare_visualization_directory()
-
-    # create a json-file based on the current time
-    file_id = "tmp_{:x}".format(int(time.time()*1000)) + ".json"
-    filename = file_id
-    configname = "config_" + filename
-
-    filepath = str(web_dir / filename)
-    configpath = str(web_dir / configname)
-
-    with open(filepath,'w') as f:
-        if type(network) in [nx.Graph, nx.DiGraph, nx.MultiDiGraph]:
-            network = nx.node_link_data(network)
-            if 'graph' in network:
-                network.update(network['graph'])
-                del network['graph']
-            json.dump(network, f, iterable_as_array=True, default=_json_default)
-        elif type(network) == dict:
-            json.dump(network, f, iterable_as_array=True, default=_json_default)
-        else:
-            raise TypeError("Netwulf only supports `nx.Graph`, `nx.DiGraph`, `nx.MultiDiGraph`, or `dict`.")
+        try:
+            while not future.done():
+                time.sleep(0.1)
+            posted_network_properties, posted_config = future.result()
+            is_keyboard_interrupted = False
+        except KeyboardInterrupt:
+            future.cancel()
+            posted_network_properties, posted_config = None, None
+            is_keyboard_interrupted = True
+    else:
+        posted_network_properties, posted_config, is_keyboard_interrupted = \
+                _visualize_once(network, port, verbose, config, is_test, debug, binary, apply_thresholds, coarsen,
+                                frames)
 
-    with open(configpath,'w') as f:
-        json.dump(this_config, f, default=_json_default)
+    # see whether or not the whole thing was started from a jupyter notebook and if yes,
+    # actually re-draw the figure and display it
+    env = os.environ
+    try:
+        is_jupyter = 'jupyter' in pathlib.PurePath(env['_']).name
+    except: # this should actually be a key error
+        # apparently this is how it has to be on Windows
+        is_jupyter = 'JPY_PARENT_PID' in env
+
+    if is_jupyter and plot_in_cell_below and not is_keyboard_interrupted:
+        if verbose:
+            print('recreating layout in matplotlib ...')
+        if posted_network_properties is not None:
+            fig, ax = wulf.draw_netwulf(posted_network_properties)
+
+    return posted_network_properties, posted_config
+
+
+def _visualize_once(network, port, verbose, config, is_test, debug, binary, apply_thresholds, coarsen, frames):
+    """
+    Run a server for a single visualization until the browser window
+    is closed. Returns the last posted network properties and config
+    and whether or not the wait was interrupted by the user.
+    """
+
+    # create routes based on the current time
+    file_id = "{:x}".format(int(time.time()*1000))
+    payloads, query = _prepare_payloads(network, config, file_id, debug=debug, verbose=verbose, binary=binary,
+                                        apply_thresholds=apply_thresholds, coarsen=coarsen, frames=frames)
 
-    # change directory to this directory
     if verbose:
-        print("changing directory to", str(web_dir))
-        print("starting server here ...", str(web_dir))
-    cwd = os.getcwd()
-    os.chdir(str(web_dir))
+        print("starting server here ...", str(html_source_path))
 
     server = NetwulfHTTPServer(("127.0.0.1", port),
                                  NetwulfHTTPRequestHandler,
-                                 [filepath, configpath],
+                                 [],
                                  verbose=verbose,
+                                 payloads=payloads,
                                  )
 
     # ========= start server ============
     thread = threading.Thread(None, server.run)
     thread.start()
 
-    url = "http://localhost:"+str(port)+"/?data=" + filename + "&config=" + configname
+    url = "http://localhost:"+str(port)+"/?" + query
     if is_test:
         url += "&pytest"
     webbrowser.open(url)
@@ -317,33 +947,117 @@ def visualize(network,
 
     if verbose:
         print('stopping server ...')
+    # the serving loop notices the end request after at most `server.timeout` seconds
+    thread.join()
     server.stop_this()
-    thread.join(0.2)
 
-    posted_network_properties = server.posted_network_properties
-    posted_config = server.posted_config
+    return server.posted_network_properties, server.posted_config, is_keyboard_interrupted
 
-    if verbose:
-        print('changing directory back to', cwd)
 
-    os.chdir(cwd)
-    
-    # see whether or not the whole thing was started from a jupyter notebook and if yes,
-    # actually re-draw the figure and display it
-    env = os.environ
-    try:
-        is_jupyter = 'jupyter' in pathlib.PurePath(env['_']).name
-    except: # this should actually be a key error
-        # apparently this is how it has to be on Windows
-        is_jupyter = 'JPY_PARENT_PID' in env
+def _frame_positions(network_properties, n_frames):
+    """
+    Get the positions of the nodes in every frame from the network
+    properties posted by the web app, which contain them as a list
+    ``'frames'`` of ``[[x, y], ...]``-lists in the order of
+    ``network_properties['nodes']``. If the web app only posted
+    the (shared) layout, it's used for all frames.
+    """
+    if network_properties is None:
+        return None
 
-    if is_jupyter and plot_in_cell_below and not is_keyboard_interrupted:
-        if verbose:
-            print('recreating layout in matplotlib ...')
-        if posted_network_properties is not None:
-            fig, ax = wulf.draw_netwulf(posted_network_properties)
+    n_nodes = len(network_properties['nodes'])
+    frames = network_properties.get('frames')
+    if frames is None:
+        xy = np.array([ [node['x'], node['y']] for node in network_properties['nodes'] ], dtype=float)
+        return np.repeat(xy.reshape(1, n_nodes, 2), n_frames, axis=0)
 
-    return posted_network_properties, posted_config
+    return np.array(frames, dtype=float).reshape(n_frames, n_nodes, 2)
+
+
+def visualize_temporal(snapshots,
+                       times=None,
+                       port=9853,
+                       verbose=False,
+                       config=None,
+                       plot_in_cell_below=True,
+                       is_test=False,
+                       debug=False,
+                       block=True,
+                       ):
+    """
+    Visualize a temporal network given as a sequence of snapshots,
+    through which the web app can scrub while reusing the layout.
+    The union of all snapshots is served once, and every snapshot
+    is sent as a compact delta of activated and deactivated nodes
+    and links (see :mod:`netwulf.tools.get_temporal_network`).
+
+    Parameters
+    ----------
+    snapshots : iterable of networkx.Graph or networkx.DiGraph
+        The states of the network at consecutive times.
+    times : iterable, default : None
+        The times of the snapshots, which are shown by the web app.
+        Defaults to ``0, 1, ...``.
+
+    The remaining parameters are the ones of
+    :mod:`netwulf.interactive.visualize`.
+
+    Returns
+    -------
+    network_properties : dict
+        contains all necessary information to redraw the figure which
+        was created in the interactive visualization, for the union
+        of all snapshots
+    config : dict
+        contains all configurational values of the interactive
+        visualization
+    positions : numpy.ndarray
+        The positions of the nodes in every frame, of shape
+        ``(number_of_snapshots, number_of_nodes, 2)``, where nodes
+        are in the order of ``network_properties['nodes']``.
+
+    If the visualization was closed before it was posted, all three
+    are ``None``. If ``block = False``, a ``concurrent.futures.Future``
+    which resolves to ``(network_properties, config, positions)``
+    is returned instead.
+
+    Example
+    -------
+        >>> snapshots = [ G.edge_subgraph(edges) for edges in edges_per_day ]
+        >>> props, config, positions = netwulf.visualize_temporal(snapshots)
+        >>> x, y = positions[-1].T
+    """
+
+    union, frames = get_temporal_network(snapshots, times=times)
+
+    result = visualize(union,
+                       port=port,
+                       verbose=verbose,
+                       config=config,
+                       plot_in_cell_below=plot_in_cell_below,
+                       is_test=is_test,
+                       debug=debug,
+                       block=block,
+                       frames=frames,
+                       )
+
+    if block:
+        network_properties, posted_config = result
+        return network_properties, posted_config, _frame_positions(network_properties, len(frames))
+
+    future = Future()
+    def _add_positions(visualization):
+        if visualization.cancelled():
+            future.cancel()
+        elif future.set_running_or_notify_cancel():
+            network_properties, posted_config = visualization.result()
+            future.set_result((network_properties, posted_config,
+                               _frame_positions(network_properties, len(frames))))
+    # cancelling the returned future cancels the visualization, too
+    future.add_done_callback(lambda _future: _future.cancelled() and result.cancel())
+    result.add_done_callback(_add_positions)
+
+    return future
 
 
 if __name__ == "__main__":
@@ -2,40 +2,939 @@
 A data input/output module for netwulf.
 """
 
+import os
+import bz2
+import gzip
+import lzma
+import codecs
+from collections.abc import Mapping
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 import simplejson as json
 import networkx as nx
+import numpy
+
+def _json_default(o):
+    if isinstance(o, numpy.int64): return int(o)
+    elif isinstance(o, numpy.float64): return float(o)
+    raise TypeError
+
+_encoder = json.JSONEncoder(separators=(',', ':'),
+                            iterable_as_array=True,
+                            default=_json_default,
+                            )
+
+def _iter_node_link_json(G, flatten_graph_attributes=False, nodes=None):
+    """
+    Internal generator which yields the node-link json of a network
+    piece by piece, equivalent to dumping ``nx.node_link_data(G)``.
+    If ``flatten_graph_attributes`` is ``True``, the graph attributes are
+    written to the top level instead of to the ``'graph'`` entry,
+    as the web app expects it. If ``nodes`` is given, these
+    ``(node, data)``-pairs are written instead of all of G's nodes.
+    """
+
+    encode = _encoder.encode
+    multigraph = G.is_multigraph()
+
+    yield '{"directed":' + encode(G.is_directed())
+    yield ',"multigraph":' + encode(multigraph)
+
+    if flatten_graph_attributes:
+        for key, value in G.graph.items():
+            if key not in ('directed', 'multigraph', 'nodes', 'links'):
+                yield ',' + encode(str(key)) + ':' + encode(value)
+    else:
+        yield ',"graph":' + encode(G.graph)
+
+    yield ',"nodes":['
+    separator = ''
+    for node, data in (G.nodes(data=True) if nodes is None else nodes):
+        node_data = dict(data)
+        node_data['id'] = node
+        yield separator + encode(node_data)
+        separator = ','
+
+    yield '],"links":['
+    separator = ''
+    if multigraph:
+        edges = G.edges(keys=True, data=True)
+    else:
+        edges = G.edges(data=True)
+    for edge in edges:
+        link = dict(edge[-1])
+        link['source'] = edge[0]
+        link['target'] = edge[1]
+        if multigraph:
+            link['key'] = edge[2]
+        yield separator + encode(link)
+        separator = ','
+
+    yield ']}'
+
+def iter_node_link_json(network, chunk_size=2**16, flatten_graph_attributes=False, nodes=None):
+    """
+    Serialize a network to node-link json incrementally, without
+    building the whole ``nx.node_link_data`` dictionary in memory.
+
+    Parameters
+    ----------
+    network : networkx.Graph or alike
+        The network to serialize.
+    chunk_size : int, default : 65536
+        Chunks are yielded as soon as they contain at least
+        this many characters.
+    flatten_graph_attributes : bool, default : False
+        Write the graph attributes to the top level of the
+        json object instead of to its ``'graph'`` entry.
+    nodes : iterable of tuple, default : None
+        ``(node, data)``-pairs that are written to the node list
+        instead of all of the network's nodes.
+
+    Yields
+    ------
+    chunk : bytes
+        A piece of the utf-8 encoded json document.
+
+    Example
+    -------
+        >>> with open("network.json", "wb") as f:
+        ...     for chunk in netwulf.iter_node_link_json(G):
+        ...         f.write(chunk)
+    """
+
+    buffer = []
+    buffered = 0
+    for piece in _iter_node_link_json(network, flatten_graph_attributes, nodes):
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield ''.join(buffer).encode()
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        yield ''.join(buffer).encode()
+
+def _node_link_graph(data):
+    """Internal function to construct a graph from node-link data with either ``'links'`` or ``'edges'``."""
+    edges = 'edges' if 'edges' in data and 'links' not in data else 'links'
+    try:
+        return nx.node_link_graph(data, edges=edges)
+    except TypeError:
+        # networkx < 3.4 only knows about 'links'
+        return nx.node_link_graph(data)
+
+# Binary columnar wire format
+# ===========================
+#
+# b'NWLF' | uint32 header length | json header | zero padding | data section
+#
+# All integers are little-endian. The data section starts at a multiple
+# of 8 bytes and every array in it starts at a multiple of 8 bytes
+# relative to the data section, such that the web app can read
+# each of them as a typed array without copying or parsing.
+
+_COLUMNAR_MAGIC = b'NWLF'
+_COLUMNAR_VERSION = 1
+
+# attributes that the web app understands and the dtype they're sent as
+_columnar_node_attributes = [('size', '<f4'),
+                             ('x', '<f4'),
+                             ('y', '<f4'),
+                             ('radius', '<f4'),
+                             ('group', 'category'),
+                             ('color', 'category'),
+                             ('label', 'str'),
+                             ]
+_columnar_link_attributes = [('weight', '<f4'),
+                             ('width', '<f4'),
+                             ]
+
+def _padding(n, alignment=8):
+    return b'\x00' * (-n % alignment)
+
+def _string_table(values):
+    """Internal function to encode strings as utf-8 blob and (n+1) offsets."""
+    encoded = [ str(v).encode() for v in values ]
+    offsets = numpy.zeros(len(encoded)+1, dtype='<u4')
+    numpy.cumsum([ len(b) for b in encoded ], out=offsets[1:])
+    return offsets, numpy.frombuffer(b''.join(encoded), dtype='u1')
+
+def _columnar_columns(values, dtype, n):
+    """
+    Internal function to encode attribute values (`None` for missing ones)
+    as arrays. Returns a column description and a list of named arrays.
+    """
+    if dtype == 'category':
+        categories = {}
+        codes = numpy.fromiter((-1 if v is None else categories.setdefault(v, len(categories)) for v in values),
+                               dtype='<i4', count=n)
+        return {'dtype': 'category', 'categories': list(categories)}, [('codes', codes)]
+    elif dtype == 'str':
+        offsets, data = _string_table('' if v is None else v for v in values)
+        return {'dtype': 'str'}, [('offsets', offsets), ('data', data)]
+    else:
+        array = numpy.fromiter((numpy.nan if v is None else v for v in values), dtype=dtype, count=n)
+        return {'dtype': dtype}, [('values', array)]
+
+def iter_columnar_network(network):
+    """
+    Serialize a network to netwulf's binary columnar format which the
+    web app can read without parsing. Node ids are mapped to dense integer
+    indices, the attributes known to the web app are sent as
+    little-endian typed arrays and string-valued attributes
+    (labels, non-integer node ids) are sent as utf-8 string tables.
+    Graph attributes are written to the top level of the header.
+
+    Parameters
+    ----------
+    network : networkx.Graph or alike
+        The network to serialize.
+
+    Yields
+    ------
+    chunk : bytes
+        Header and arrays of the binary document.
+
+    Example
+    -------
+        >>> data = b''.join(netwulf.iter_columnar_network(G))
+        >>> network = netwulf.read_columnar_network(data)
+    """
+
+    N = network.number_of_nodes()
+    M = network.number_of_edges()
+    nodes = []
+    node_data = []
+    for node, d in network.nodes(data=True):
+        nodes.append(node)
+        node_data.append(d)
+    index = { node: i for i, node in enumerate(nodes) }
+
+    # walk the edges only once, since that is the expensive part
+    edge_data = []
+    def endpoints():
+        for u, v, d in network.edges(data=True):
+            edge_data.append(d)
+            yield index[u]
+            yield index[v]
+    endpoints = numpy.fromiter(endpoints(), dtype='<u4', count=2*M).reshape(M, 2)
+
+    columns = {'nodes': {}, 'links': {}}
+    arrays = []
+
+    def add(table, name, description, named_arrays):
+        columns[table][name] = description
+        for array_name, array in named_arrays:
+            description[array_name] = array
+            arrays.append((description, array_name, array))
+
+    # node ids
+    if all(type(node) == int and abs(node) < 2**53 for node in nodes):
+        add('nodes', 'id', *_columnar_columns(nodes, '<f8', N))
+    else:
+        add('nodes', 'id', *_columnar_columns(nodes, 'str', N))
+
+    for key, dtype in _columnar_node_attributes:
+        if any(key in d for d in node_data):
+            add('nodes', key, *_columnar_columns((d.get(key) for d in node_data), dtype, N))
+
+    # links as node indices
+    add('links', 'source', {'dtype': '<u4'}, [('values', numpy.ascontiguousarray(endpoints[:,0]))])
+    add('links', 'target', {'dtype': '<u4'}, [('values', numpy.ascontiguousarray(endpoints[:,1]))])
+
+    for key, dtype in _columnar_link_attributes:
+        if any(key in d for d in edge_data):
+            add('links', key, *_columnar_columns((d.get(key) for d in edge_data), dtype, M))
+
+    # replace arrays by their position in the data section
+    offset = 0
+    for description, array_name, array in arrays:
+        description[array_name] = {'offset': offset, 'length': len(array)}
+        offset += array.nbytes + len(_padding(array.nbytes))
+
+    header = {
+        'version': _COLUMNAR_VERSION,
+        'directed': network.is_directed(),
+        'multigraph': network.is_multigraph(),
+        'graph': network.graph,
+        'nodes': N,
+        'links': M,
+        'columns': columns,
+    }
+    header = _encoder.encode(header).encode()
+    header_length = len(_COLUMNAR_MAGIC) + 4 + len(header)
+
+    yield _COLUMNAR_MAGIC + numpy.uint32(len(header)).astype('<u4').tobytes() + header + _padding(header_length)
+
+    for _, _, array in arrays:
+        yield array.tobytes() + _padding(array.nbytes)
+
+def read_columnar_network(data):
+    """
+    Decode a network from netwulf's binary columnar format
+    to a node-link dictionary as it is sent to the web app
+    in json-format.
+
+    Parameters
+    ----------
+    data : bytes-like
+        The binary document as produced by :mod:`netwulf.io.iter_columnar_network`.
+
+    Returns
+    -------
+    network : dict
+        Node-link dictionary of the network. Missing attribute
+        values are omitted.
+    """
+
+    data = memoryview(data)
+    if bytes(data[:4]) != _COLUMNAR_MAGIC:
+        raise ValueError("Not a netwulf columnar network.")
+
+    header_length = int(numpy.frombuffer(data[4:8], dtype='<u4')[0])
+    header = json.loads(bytes(data[8:8+header_length]).decode())
+    start = 8 + header_length
+    start += len(_padding(start))
+
+    def array(entry, dtype):
+        return numpy.frombuffer(data, dtype=dtype, count=entry['length'], offset=start+entry['offset'])
+
+    def decode(description):
+        dtype = description['dtype']
+        if dtype == 'category':
+            categories = description['categories']
+            return [ None if c < 0 else categories[c] for c in array(description['codes'], '<i4').tolist() ]
+        elif dtype == 'str':
+            offsets = array(description['offsets'], '<u4').tolist()
+            blob = array(description['data'], 'u1').tobytes()
+            return [ blob[a:b].decode() or None for a, b in zip(offsets[:-1], offsets[1:]) ]
+        else:
+            values = array(description['values'], dtype).tolist()
+            return [ None if v != v else v for v in values ]
+
+    tables = {}
+    for table, n in [('nodes', header['nodes']), ('links', header['links'])]:
+        columns = { name: decode(description) for name, description in header['columns'][table].items() }
+        # integer-valued node ids are sent as float64
+        if table == 'nodes' and columns['id'] and type(columns['id'][0]) == float:
+            columns['id'] = [ int(i) for i in columns['id'] ]
+        tables[table] = [ { name: values[i] for name, values in columns.items() if values[i] is not None }
+                          for i in range(n) ]
+
+    ids = [ node['id'] for node in tables['nodes'] ]
+    for link in tables['links']:
+        link['source'] = ids[link['source']]
+        link['target'] = ids[link['target']]
+
+    network = {
+        'directed': header['directed'],
+        'multigraph': header['multigraph'],
+        'nodes': tables['nodes'],
+        'links': tables['links'],
+    }
+    network.update(header['graph'])
+
+    return network
+
+# the parts of a saved visualization
+_parts = ('stylized_network', 'config', 'Graph')
+
+def _check_parts(parts):
+    if parts is None:
+        return _parts
+    parts = tuple(parts)
+    for part in parts:
+        if part not in _parts:
+            raise ValueError("Unknown part '{}', choose from {}.".format(part, _parts))
+    return parts
+
+# Binary container format for saved visualizations
+# =================================================
+#
+# b'NWLB' | uint32 header length | json header | zero padding | data section
+#
+# The header holds the config, the global style properties and the
+# description of every node and link column. Columns are 8-byte-aligned
+# arrays in the data section, such that each of them can be read from
+# a memory map without copying. The node-link json of the graph
+# (if any) is written to the end of the data section.
+
+_BINARY_MAGIC = b'NWLB'
+_BINARY_VERSION = 1
+
+def _type_kind(value_type):
+    if issubclass(value_type, bool):
+        return 'other'
+    elif issubclass(value_type, (int, numpy.integer)):
+        return 'int'
+    elif issubclass(value_type, (float, numpy.floating)):
+        return 'float'
+    elif issubclass(value_type, str):
+        return 'str'
+    return 'other'
+
+def _binary_column(values):
+    """
+    Internal function to encode a list of attribute values (`None` for
+    missing ones) as arrays, choosing the dtype by the values' types.
+    Returns a column description and a list of named arrays.
+    """
+    n = len(values)
+    present = [ v for v in values if v is not None ]
+    kinds = { _type_kind(t) for t in set(map(type, present)) }
+
+    if kinds == {'int'} and len(present) == n:
+        return {'dtype': '<i8'}, [('values', numpy.array(values, dtype='<i8'))]
+    elif kinds <= {'int', 'float'} and present:
+        array = numpy.array([ numpy.nan if v is None else v for v in values ], dtype='<f8')
+        return {'dtype': '<f8', 'integer': kinds == {'int'}}, [('values', array)]
+
+    if kinds == {'str'}:
+        encoded = values
+        dtype = 'str'
+        distinct = len(set(present))
+        if distinct <= max(256, n // 16):
+            description, arrays = _columnar_columns(values, 'category', n)
+            return description, arrays
+    else:
+        encoded = [ None if v is None else _encoder.encode(v) for v in values ]
+        dtype = 'json'
+
+    offsets, data = _string_table('' if v is None else v for v in encoded)
+    arrays = [('offsets', offsets), ('data', data)]
+    if len(present) < n:
+        arrays.append(('valid', numpy.array([ v is not None for v in values ], dtype='u1')))
+    return {'dtype': dtype}, arrays
+
+def _write_binary(f, stylized_network, config, G):
+    """Internal function to write everything to a binary file object."""
+
+    nodes = stylized_network['nodes']
+    links = stylized_network['links']
+    index = { node['id']: i for i, node in enumerate(nodes) }
+
+    columns = {'nodes': {}, 'links': {}}
+    arrays = []
+
+    def add(table, name, description, named_arrays):
+        columns[table][name] = description
+        for array_name, array in named_arrays:
+            description[array_name] = array
+            arrays.append((description, array_name, array))
+
+    for table, items in [('nodes', nodes), ('links', links)]:
+        keys = {}
+        for item in items:
+            keys.update(dict.fromkeys(item))
+        for key in keys:
+            if table == 'links' and key in ('source', 'target'):
+                # links refer to their nodes' positions in the node columns
+                endpoints = numpy.array([ index[link[key]] for link in links ], dtype='<u4')
+                add(table, key, {'dtype': 'index'}, [('values', endpoints)])
+            else:
+                add(table, key, *_binary_column([ item.get(key) for item in items ]))
+
+    # replace arrays by their position in the data section
+    offset = 0
+    for description, array_name, array in arrays:
+        description[array_name] = {'offset': offset, 'length': len(array)}
+        offset += array.nbytes + len(_padding(array.nbytes))
+
+    header = {
+        'version': _BINARY_VERSION,
+        'stylized_network': { key: value for key, value in stylized_network.items()
+                                         if key not in ('nodes', 'links') },
+        'config': config,
+        'nodes': len(nodes),
+        'links': len(links),
+        'columns': columns,
+        'Graph': None if G is None else {'offset': offset},
+    }
+    header = _encoder.encode(header).encode()
+    header_length = len(_BINARY_MAGIC) + 4 + len(header)
+
+    f.write(_BINARY_MAGIC + numpy.uint32(len(header)).astype('<u4').tobytes() + header + _padding(header_length))
+
+    for _, _, array in arrays:
+        f.write(array.tobytes() + _padding(array.nbytes))
+
+    if G is not None:
+        for chunk in iter_node_link_json(G):
+            f.write(chunk)
+
+class _LazyColumns(Mapping):
+    """
+    Read-only mapping of column names to arrays which are
+    decoded from the data section on first access.
+    """
+
+    def __init__(self, descriptions, decode):
+        self._descriptions = descriptions
+        self._decode = decode
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._descriptions)
+
+    def __iter__(self):
+        return iter(self._descriptions)
+
+    def __getitem__(self, name):
+        if name not in self._columns:
+            self._columns[name] = self._decode(self._descriptions[name])
+        return self._columns[name]
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, list(self._descriptions))
+
+def _read_binary(data, as_arrays=False, parts=_parts):
+    """Internal function to read the requested parts from a binary buffer (bytes or memory map)."""
+
+    if bytes(data[:4]) != _BINARY_MAGIC:
+        raise ValueError("Not a netwulf binary file.")
+
+    header_length = int(numpy.frombuffer(data[4:8], dtype='<u4')[0])
+    header = json.loads(bytes(data[8:8+header_length]).decode())
+    start = 8 + header_length
+    start += len(_padding(start))
+
+    def array(entry, dtype):
+        return numpy.frombuffer(data, dtype=dtype, count=entry['length'], offset=start+entry['offset'])
+
+    def decode(description):
+        dtype = description['dtype']
+        if dtype == 'category':
+            categories = numpy.empty(len(description['categories'])+1, dtype=object)
+            categories[:-1] = description['categories']
+            return categories[array(description['codes'], '<i4')]
+        elif dtype in ('str', 'json'):
+            offsets = array(description['offsets'], '<u4').tolist()
+            blob = array(description['data'], 'u1').tobytes()
+            values = numpy.empty(len(offsets)-1, dtype=object)
+            values[:] = [ blob[a:b].decode() for a, b in zip(offsets[:-1], offsets[1:]) ]
+            if dtype == 'json':
+                values[:] = [ json.loads(v) if v else None for v in values ]
+            if 'valid' in description:
+                values[array(description['valid'], 'u1') == 0] = None
+            return values
+        elif dtype == 'index':
+            return array(description['values'], '<u4')
+        else:
+            return array(description['values'], dtype)
+
+    stylized_network = dict(header['stylized_network'])
+    config = header['config'] if 'config' in parts else None
+    tables = { table: _LazyColumns(header['columns'][table], decode) for table in ('nodes', 'links') }
+
+    if 'stylized_network' not in parts:
+        stylized_network = None
+    elif as_arrays:
+        stylized_network.update(tables)
+    else:
+        for table, n in [('nodes', header['nodes']), ('links', header['links'])]:
+            columns = {}
+            for name, description in header['columns'][table].items():
+                values = tables[table][name].tolist()
+                if description.get('integer'):
+                    values = [ None if v != v else int(v) for v in values ]
+                elif description['dtype'] == '<f8':
+                    values = [ None if v != v else v for v in values ]
+                columns[name] = values
+            stylized_network[table] = [ { name: values[i] for name, values in columns.items() if values[i] is not None }
+                                        for i in range(n) ]
+
+        ids = [ node['id'] for node in stylized_network['nodes'] ]
+        for link in stylized_network['links']:
+            link['source'] = ids[link['source']]
+            link['target'] = ids[link['target']]
+
+    G = header['Graph']
+    if G is not None and 'Graph' in parts:
+        G = _node_link_graph(json.loads(bytes(data[start+G['offset']:]).decode()))
+    else:
+        G = None
+
+    return stylized_network, config, G
+
+def save_binary(f,stylized_network,config,G=None):
+    """
+    Save a visualization in netwulf's binary container format, in
+    which node and link properties are stored as raw arrays, such that
+    opening large visualizations with :mod:`netwulf.io.load_binary`
+    is fast.
+
+    Parameters
+    ----------
+    f : file-like object or str
+        The file to which to write (opened in binary mode).
+    stylized_network : dict
+        dictionary returned by :mod:`netwulf.interactive.visualize`
+    config : dict
+        dictionary returned by :mod:`netwulf.interactive.visualize`
+    G : networkx.Graph or similar, default : None
+        Graph object from which the whole thing was generated.
+
+    Example
+    -------
+        >>> G = networkx.fast_gnp_random_graph(10,0.3)
+        >>> style_nw, cf = netwulf.visualize(G)
+        >>> netwulf.save_binary("ER.nwlb",style_nw,cf,G)
+    """
+
+    if hasattr(f, 'write'):
+        _write_binary(f,stylized_network,config,G)
+    else:
+        with open(f,'wb') as _f:
+            _write_binary(_f,stylized_network,config,G)
+
+def load_binary(f,as_arrays=False,parts=None):
+    """
+    Load a visualization saved with :mod:`netwulf.io.save_binary`.
+    Files are memory-mapped, such that only the parts
+    which are actually read are loaded from disk.
+
+    Parameters
+    ----------
+    f : file-like object or str
+        The file from which to read (opened in binary mode).
+    as_arrays : bool, default : False
+        If ``True``, the entries ``'nodes'`` and ``'links'`` of the stylized
+        network map property names to arrays (e.g. ``stylized_network['nodes']['x']``)
+        which are read from the memory map when they're first accessed.
+        The ``'source'`` and ``'target'`` arrays of the links hold the
+        positions of the links' nodes in the node arrays.
+    parts : iterable of str, default : None
+        The parts to load, any of ``'stylized_network'``, ``'config'``
+        and ``'Graph'``. Parts that aren't requested are returned as ``None``.
+        If ``None``, everything is loaded.
+
+    Returns
+    -------
+    stylized_network : dict
+        dictionary returned by :mod:`netwulf.interactive.visualize`
+    config : dict
+        dictionary returned by :mod:`netwulf.interactive.visualize`
+    G : networkx.Graph or similar, default : None
+        Graph object from which the whole thing was generated.
+
+    Example
+    -------
+        >>> style_nw, cf, G = netwulf.load_binary("ER.nwlb",as_arrays=True)
+        >>> x, y = style_nw['nodes']['x'], style_nw['nodes']['y']
+    """
+
+    parts = _check_parts(parts)
+
+    if hasattr(f, 'read'):
+        return _read_binary(memoryview(f.read()), as_arrays, parts)
+    else:
+        return _read_binary(numpy.memmap(f, dtype='u1', mode='r'), as_arrays, parts)
+
+# Compressed json-files
+# =====================
+
+# compression methods of file extensions
+_compression_extensions = {'.gz': 'gzip',
+                           '.bz2': 'bz2',
+                           '.xz': 'xz',
+                           '.zst': 'zstd',
+                           }
+
+# compression methods of magic bytes at the start of files
+_compression_magic = {b'\x1f\x8b': 'gzip',
+                      b'BZh': 'bz2',
+                      b'\xfd7zXZ\x00': 'xz',
+                      b'\x28\xb5\x2f\xfd': 'zstd',
+                      }
+
+def _compression_method(path, compression, magic=None):
+    """
+    Internal function to get the compression method (``None`` for
+    uncompressed files) and the options passed to the codec. If the
+    method is ``'infer'``, it's inferred from the ``magic`` bytes
+    of the file or, if they're not given, the file extension.
+    """
+
+    if isinstance(compression, dict):
+        options = dict(compression)
+        method = options.pop('method', 'infer')
+    else:
+        method, options = compression, {}
+
+    if method == 'infer':
+        if magic is not None:
+            method = next((codec for prefix, codec in _compression_magic.items()
+                                 if magic.startswith(prefix)), None)
+        else:
+            method = _compression_extensions.get(os.path.splitext(os.fspath(path))[1].lower())
+
+    if method is not None and method not in _compression_extensions.values():
+        raise ValueError("Unknown compression '{}', choose from {}.".format(
+                         method, sorted(_compression_extensions.values())))
+
+    return method, options
+
+def _open(path, mode, method, options):
+    """Internal function to open a (compressed) file in text mode ``'r'`` or ``'w'``, streaming the compression."""
+
+    if method is None:
+        return open(path, mode)
+    elif method == 'gzip':
+        return gzip.open(path, mode+'t', encoding='utf-8', **options)
+    elif method == 'bz2':
+        return bz2.open(path, mode+'t', encoding='utf-8', **options)
+    elif method == 'xz':
+        return lzma.open(path, mode+'t', encoding='utf-8', **options)
+    elif method == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstd-compression needs the `zstandard` package, install it with `pip install zstandard`.")
+        if mode == 'w':
+            options = {'cctx': zstandard.ZstdCompressor(**options)}
+        return zstandard.open(path, mode+'t', encoding='utf-8', **options)
 
 def _write(f,stylized_network,config,G):
     """Internal function to write the everything to a json-file."""
 
+    f.write('{"stylized_network":' + _encoder.encode(stylized_network))
+    f.write(',"config":' + _encoder.encode(config))
+    f.write(',"Graph":')
     if G is not None:
-        js_G = nx.node_link_data(G)
+        for piece in _iter_node_link_json(G):
+            f.write(piece)
     else:
-        js_G = None
-
-    json.dump({
-                'stylized_network' : stylized_network,
-                'config' : config,
-                'Graph' : js_G
-              },
-              f,
-              separators=(',', ':'),
-              )
+        f.write('null')
+    f.write('}')
 
-def _read(f):
-    """Internal function to read everything from a json-file."""
+def _read(f, parts=_parts):
+    """Internal function to read the requested parts from a json-file."""
 
     data = json.load(f)
             
-    stylized_network = data['stylized_network']
-    config = data['config']
-    G = data['Graph']
+    stylized_network = data['stylized_network'] if 'stylized_network' in parts else None
+    config = data['config'] if 'config' in parts else None
+    G = data['Graph'] if 'Graph' in parts else None
     if G is not None:
-        G = nx.node_link_graph(data['Graph'])
+        G = _node_link_graph(data['Graph'])
 
     return stylized_network, config, G
 
-def save(f,stylized_network,config,G=None):
+class _JSONStream(object):
+    """
+    Internal event-based json reader which reads a file chunk by chunk,
+    such that values can be iterated over, decoded or skipped
+    without holding the whole document in memory.
+    Scalars and the elements of iterated containers are
+    decoded with simplejson's scanner.
+    """
+
+    def __init__(self, f, chunk_size=2**20):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = None
+        decoder = json.JSONDecoder()
+        self.raw_decode = decoder.raw_decode
+        self.scan_once = decoder.scan_once
+
+    def _read(self, size):
+        """Append at least ``size`` characters (if available) to the buffer."""
+        chunk = self.f.read(size)
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self.decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """Return the next non-whitespace character (``''`` at the end of the file)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos+1]
+            self._read(self.chunk_size)
+
+    def expect(self, characters):
+        character = self.peek()
+        if character == '' or character not in characters:
+            raise ValueError("Expected one of '{}' at position {} of the buffer, got '{}'.".format(
+                             characters, self.pos, character))
+        self.pos += 1
+        return character
+
+    def decode(self):
+        """Decode the next value completely."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # numbers might continue in the next chunk
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in '.eE+-0123456789'):
+                    self.pos = end
+                    return value
+            # read at least as much as is buffered, such that
+            # decoding large values takes linear time
+            self._read(max(size, len(self.buffer)))
+
+    def skip(self, depth=2):
+        """
+        Skip the next value, iterating over containers up to ``depth``
+        levels deep, such that only single elements are decoded at once.
+        """
+        character = self.peek()
+        if depth <= 0 or character not in '{[':
+            self.decode()
+        elif character == '{':
+            for _ in self.iter_object():
+                self.skip(depth-1)
+        elif depth == 1:
+            for _ in self.iter_values():
+                pass
+        else:
+            for _ in self.iter_array():
+                self.skip(depth-1)
+
+    def iter_array(self):
+        """Iterate over the elements of the next array, which are decoded by the caller."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.expect(',]') == ']':
+                return
+
+    def iter_values(self):
+        """Iterate over the decoded elements of the next array."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        scan_once = self.scan_once
+        while True:
+            buffer = self.buffer
+            try:
+                value, end = scan_once(buffer, self.pos)
+                delimiter = buffer[end:end+1]
+            except (json.JSONDecodeError, StopIteration):
+                delimiter = ''
+            if delimiter == ',' or delimiter == ']':
+                self.pos = end + 1
+                yield value
+            else:
+                # the element reaches the end of the buffer or is surrounded by whitespace
+                yield self.decode()
+                delimiter = self.expect(',]')
+            if delimiter == ']':
+                return
+
+    def iter_object(self):
+        """Iterate over the keys of the next object, whose values are decoded by the caller."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(':')
+            yield key
+            if self.expect(',}') == '}':
+                return
+
+    def decode_containers(self, depth):
+        """Decode the next value, iterating over containers up to ``depth`` levels deep."""
+        character = self.peek()
+        if depth <= 0 or character not in '{[':
+            return self.decode()
+        elif character == '{':
+            return { key: self.decode_containers(depth-1) for key in self.iter_object() }
+        elif depth == 1:
+            return list(self.iter_values())
+        else:
+            return [ self.decode_containers(depth-1) for _ in self.iter_array() ]
+
+def _to_tuple(value):
+    """Convert lists to tuples like ``nx.node_link_graph`` does for node ids."""
+    if isinstance(value, list):
+        return tuple(map(_to_tuple, value))
+    return value
+
+def _read_graph_incremental(stream):
+    """
+    Internal function to construct a graph from a node-link json
+    object in the stream, adding nodes and links while they're read.
+    """
+    if stream.peek() == 'n':
+        return stream.decode()
+
+    data = {}
+    G = None
+    for key in stream.iter_object():
+        if key in ('nodes', 'links', 'edges'):
+            if G is None:
+                G = nx.MultiGraph() if data.get('multigraph', True) else nx.Graph()
+                if data.get('directed', False):
+                    G = G.to_directed_class()()
+                G.graph = data.get('graph', {})
+            for d in stream.iter_values():
+                if key == 'nodes':
+                    G.add_node(_to_tuple(d.pop('id')), **d)
+                else:
+                    u = _to_tuple(d.pop('source'))
+                    v = _to_tuple(d.pop('target'))
+                    if G.is_multigraph():
+                        G.add_edge(u, v, d.pop('key', None), **d)
+                    else:
+                        G.add_edge(u, v, **d)
+        else:
+            data[key] = stream.decode()
+            if G is not None and key == 'graph':
+                G.graph = data[key]
+
+    if G is None:
+        G = _node_link_graph(data)
+
+    return G
+
+def _read_incremental(f, parts=_parts):
+    """
+    Internal function to read the requested parts from a json-file
+    incrementally. Node and link lists are decoded element by element
+    and parts that aren't requested are skipped without keeping them.
+    """
+
+    stream = _JSONStream(f)
+    data = { part: None for part in _parts }
+
+    for key in stream.iter_object():
+        if key not in parts:
+            stream.skip()
+        elif key == 'Graph':
+            data[key] = _read_graph_incremental(stream)
+        else:
+            # iterate over the node and link lists of the stylized network
+            data[key] = stream.decode_containers(2)
+
+    return data['stylized_network'], data['config'], data['Graph']
+
+def save(f,stylized_network,config,G=None,compression='infer'):
     """
     Parameters
     ----------
@@ -47,26 +946,56 @@ def save(f,stylized_network,config,G=None):
         dictionary returned by :mod:`netwulf.interactive.visualize`
     G : networkx.Graph or similar, default : None
         Graph object from which the whole thing was generated.
+    compression : str or dict or None, default : 'infer'
+        If ``f`` is a path, compress the file while writing with
+        ``'gzip'``, ``'bz2'``, ``'xz'`` or ``'zstd'`` (needs the
+        ``zstandard`` package). For ``'infer'``, the method is
+        taken from the file extension (``.gz``, ``.bz2``, ``.xz``, ``.zst``)
+        and ``None`` disables compression. Pass a dict with the method
+        as ``'method'`` and additional options for the codec, e.g.
+        ``{'method': 'gzip', 'compresslevel': 1}``, ``{'method': 'xz', 'preset': 1}``
+        or ``{'method': 'zstd', 'level': 3}``.
 
     Example
     -------
         >>> G = networkx.fast_gnp_random_graph(10,0.3)
         >>> style_nw, cf = netwulf.visualize(G)
         >>> netwulf.save("ER.json",style_nw,cf,G)
+        >>> netwulf.save("ER.json.gz",style_nw,cf,G)
     """
 
     if hasattr(f, 'write'):
         _write(f,stylized_network,config,G)
     else:
-        with open(f,'w') as _f:
+        method, options = _compression_method(f, compression)
+        with _open(f,'w',method,options) as _f:
             _write(_f,stylized_network,config,G)
 
-def load(f):
+def load(f,parts=None,incremental=False,compression='infer'):
     """
+    Load a visualization saved with :mod:`netwulf.io.save`
+    (or, if ``f`` is a path, with :mod:`netwulf.io.save_binary`).
+
     Parameters
     ----------
     f : file-like object or str
         The file to which to write.
+    parts : iterable of str, default : None
+        The parts to load, any of ``'stylized_network'``, ``'config'``
+        and ``'Graph'``. Parts that aren't requested are returned as
+        ``None``, e.g. the graph isn't constructed if only the stylized
+        network is needed for redrawing. If ``None``, everything is loaded.
+    incremental : bool, default : False
+        Read the json-file chunk by chunk and decode the node and link
+        lists element by element instead of parsing the whole document
+        at once, such that the file's content is never held in memory
+        as a whole. Use this for very large files.
+    compression : str or dict or None, default : 'infer'
+        If ``f`` is a path, decompress the file while reading with
+        ``'gzip'``, ``'bz2'``, ``'xz'`` or ``'zstd'`` (needs the
+        ``zstandard`` package). For ``'infer'``, the method is
+        detected from the first bytes of the file and ``None``
+        treats the file as uncompressed.
 
     Returns
     -------
@@ -83,11 +1012,20 @@ def load(f):
         >>> style_nw, cf = netwulf.visualize(G)
         >>> netwulf.save("ER.json",style_nw,cf,G)
         >>> style_nw,cf,G = netwulf.load("ER.json")
+        >>> style_nw,_,_ = netwulf.load("ER.json",parts=['stylized_network'])
+        >>> style_nw,cf,G = netwulf.load("ER.json.gz")
     """
 
+    parts = _check_parts(parts)
+    read = _read_incremental if incremental else _read
+
     if hasattr(f, 'read'):
-        return _read(f)
+        return read(f, parts)
     else:
-        with open(f,'r') as _f:
-            return _read(_f)
-
+        with open(f,'rb') as _f:
+            magic = _f.read(max(len(_BINARY_MAGIC), *map(len, _compression_magic)))
+        if magic.startswith(_BINARY_MAGIC):
+            return load_binary(f, parts=parts)
+        method, _ = _compression_method(f, compression, magic)
+        with _open(f,'r',method,{}) as _f:
+            return read(_f, parts)
@@ -0,0 +1,346 @@
+"""
+A headless force-directed layout engine which follows the physics
+of the interactive visualization (d3-force), such that networks can
+be laid out and redrawn without a browser.
+"""
+
+from copy import deepcopy
+
+import numpy as np
+import networkx as nx
+from matplotlib.colors import is_color_like, to_hex
+
+from netwulf.interactive import default_config
+from netwulf.tools import get_thresholded_network
+
+# d3's category10 scheme, used for node groups which aren't colors
+_group_colors = [
+    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf',
+]
+
+# d3-force defaults
+_alpha_min = 0.001
+_velocity_decay = 0.4
+_collision_strength = 0.7
+_initial_radius = 10
+_initial_angle = np.pi * (3 - np.sqrt(5))
+
+# FFTs of the many-body kernel, keyed by grid size
+_kernels = {}
+
+def _many_body_kernel(grid_size):
+    """
+    Get the FFTs of the x- and y-components of the kernel
+    ``-d/|d|^2`` on a zero-padded grid (in units of grid cells).
+    """
+    if grid_size not in _kernels:
+        n = 2 * grid_size
+        d = np.arange(n)
+        d[d >= grid_size] -= n
+        dx, dy = np.meshgrid(d, d, indexing='ij')
+        r2 = (dx**2 + dy**2).astype(float)
+        r2[0, 0] = 1.0
+        kx = -dx / r2
+        ky = -dy / r2
+        kx[0, 0] = ky[0, 0] = 0.0
+        _kernels[grid_size] = (np.fft.rfft2(kx), np.fft.rfft2(ky))
+    return _kernels[grid_size]
+
+def _many_body_field(pos, grid_size):
+    """
+    Approximate the field ``sum_j (r_j - r_i) / |r_j - r_i|^2``
+    at every node position ``r_i`` with the particle-mesh method,
+    i.e. by depositing the nodes on a grid (cloud in cell), convolving
+    with the kernel using FFTs, and interpolating the result back.
+    The cost is O(N + G^2 log G) instead of O(N^2).
+    """
+    G = grid_size
+    lo = pos.min(axis=0)
+    h = max((pos.max(axis=0) - lo).max() / (G - 1), 1e-9)
+
+    g = (pos - lo) / h
+    i = np.clip(np.floor(g).astype(int), 0, G - 2)
+    f = g - i
+
+    # weights and flat grid indices of the four surrounding grid points
+    corners = []
+    for di, wx in [(0, 1 - f[:, 0]), (1, f[:, 0])]:
+        for dj, wy in [(0, 1 - f[:, 1]), (1, f[:, 1])]:
+            corners.append(((i[:, 0] + di) * G + i[:, 1] + dj, wx * wy))
+
+    density = np.zeros(G * G)
+    for index, weight in corners:
+        density += np.bincount(index, weights=weight, minlength=G * G)
+
+    kx, ky = _many_body_kernel(G)
+    density = np.fft.rfft2(density.reshape(G, G), s=(2 * G, 2 * G))
+    ex = np.fft.irfft2(density * kx, s=(2 * G, 2 * G))[:G, :G].ravel()
+    ey = np.fft.irfft2(density * ky, s=(2 * G, 2 * G))[:G, :G].ravel()
+
+    field = np.zeros_like(pos)
+    for index, weight in corners:
+        field[:, 0] += ex[index] * weight
+        field[:, 1] += ey[index] * weight
+
+    return field / h
+
+def _neighbor_pairs(pos, cutoff):
+    """
+    Find all pairs of nodes that are closer than ``cutoff`` to
+    each other by hashing positions to grid cells of size ``cutoff``.
+    Returns two index arrays ``i < j``.
+    """
+    cells = np.floor((pos - pos.min(axis=0)) / cutoff).astype(np.int64)
+    width = cells[:, 1].max() + 3
+    key = (cells[:, 0] + 1) * width + cells[:, 1] + 1
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+
+    I, J = [], []
+    for dx, dy in [(0, 0), (0, 1), (1, -1), (1, 0), (1, 1)]:
+        # querying in sorted order is much faster
+        neighbor_key = sorted_key + dx * width + dy
+        start = np.searchsorted(sorted_key, neighbor_key, side='left')
+        count = np.searchsorted(sorted_key, neighbor_key, side='right') - start
+
+        # expand the ranges [start, start+count) to flat index arrays
+        i = np.repeat(order, count)
+        offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        j = order[np.repeat(start, count) + offsets]
+
+        if dx == 0 and dy == 0:
+            keep = i < j
+            i, j = i[keep], j[keep]
+        I.append(i)
+        J.append(j)
+
+    i = np.concatenate(I)
+    j = np.concatenate(J)
+    close = ((pos[i] - pos[j])**2).sum(axis=1) < cutoff**2
+
+    return i[close], j[close]
+
+def _jiggle(rng, shape):
+    return (rng.random(shape) - 0.5) * 1e-6
+
+def _node_colors(node_data, config):
+    """Colors of the nodes, following the web app's treatment of the ``'group'`` attribute."""
+    groups = {}
+    colors = []
+    for d in node_data:
+        group = d.get('group')
+        if group is None:
+            colors.append(config['node_fill_color'])
+        elif isinstance(group, str) and is_color_like(group):
+            colors.append(to_hex(group))
+        else:
+            index = groups.setdefault(group, len(groups))
+            colors.append(_group_colors[index % len(_group_colors)])
+    return colors
+
+def force_layout(network,
+                 config=None,
+                 iterations=None,
+                 grid_size=None,
+                 canvas_size=None,
+                 seed=None,
+                 ):
+    """
+    Lay out a network without a browser, using a NumPy implementation
+    of the force simulation that runs in the interactive visualization.
+    The many-body force is approximated on a grid, such that
+    networks with hundreds of thousands of nodes can be laid out.
+
+    Parameters
+    ----------
+    network : networkx.Graph or alike
+        The network to lay out. If every node has the attributes
+        ``'x'`` and ``'y'`` (e.g. after calling
+        :mod:`netwulf.tools.bind_properties_to_network`), these positions
+        are kept fixed, like the web app does.
+    config : dict, default : None
+        Overwrites the corresponding values of
+        :mod:`netwulf.interactive.default_config`. The physics keys
+        ``'node_charge'``, ``'node_gravity'``, ``'link_distance'``,
+        ``'link_distance_variation'``, ``'node_collision'`` and
+        ``'freeze_nodes'``, the node and link styling keys as well
+        as the thresholding keys are respected, i.e. only the nodes and
+        links that pass the thresholds are laid out and returned.
+    iterations : int, default : None
+        Number of simulation ticks. If ``None``, the simulation runs
+        until it cooled down, like d3-force's (300 ticks).
+    grid_size : int, default : None
+        Number of grid cells per dimension used to approximate the
+        many-body force. If ``None``, it's chosen according to the
+        number of nodes.
+    canvas_size : float, default : None
+        Side length of the square canvas. If ``None``, the canvas
+        is chosen such that all nodes fit.
+    seed : int, default : None
+        Seed for the random jiggling of coinciding nodes.
+
+    Returns
+    -------
+    network_properties : dict
+        contains all necessary information to draw the network with
+        :mod:`netwulf.tools.draw_netwulf`, just as returned by
+        :mod:`netwulf.interactive.visualize`
+    config : dict
+        contains all configurational values used for the layout
+
+    Example
+    -------
+        >>> props, config = netwulf.force_layout(G, config={'node_charge': -30})
+        >>> fig, ax = netwulf.draw_netwulf(props)
+    """
+
+    this_config = deepcopy(default_config)
+    if config is not None:
+        this_config.update(config)
+    config = this_config
+
+    network, _ = get_thresholded_network(network, config)
+
+    rng = np.random.default_rng(seed)
+
+    nodes = []
+    node_data = []
+    for node, d in network.nodes(data=True):
+        nodes.append(node)
+        node_data.append(d)
+    index = { node: i for i, node in enumerate(nodes) }
+    N = len(nodes)
+
+    links = [ (index[u], index[v], d) for u, v, d in network.edges(data=True) ]
+    source = np.array([ s for s, _, _ in links ], dtype=int)
+    target = np.array([ t for _, t, _ in links ], dtype=int)
+    weight = np.array([ d.get('weight', 1) for _, _, d in links ], dtype=float)
+    if len(weight) > 0 and weight.max() > 0:
+        relative_weight = weight / weight.max()
+    else:
+        relative_weight = np.ones_like(weight)
+
+    # node radii
+    if config['scale_node_size_by_strength']:
+        size = np.bincount(source, weights=weight, minlength=N) \
+             + np.bincount(target, weights=weight, minlength=N)
+        size[size == 0] = 1
+    elif any('size' in d for d in node_data):
+        size = np.array([ d.get('size', 1) for d in node_data ], dtype=float)
+    else:
+        size = np.ones(N)
+    radius = config['node_size'] * (size / size.max()) ** config['node_size_variation'] if N > 0 else size
+
+    width = config['link_width'] * relative_weight ** config['link_width_variation']
+
+    # initial positions
+    has_positions = N > 0 and all('x' in d and 'y' in d for d in node_data)
+    if has_positions:
+        pos = np.array([ [d['x'], d['y']] for d in node_data ], dtype=float)
+    else:
+        r = _initial_radius * np.sqrt(0.5 + np.arange(N))
+        angle = np.arange(N) * _initial_angle
+        pos = np.column_stack([r * np.cos(angle), r * np.sin(angle)])
+
+    if not has_positions and not config['freeze_nodes'] and N > 0:
+        if grid_size is None:
+            grid_size = int(np.clip(2**np.ceil(np.log2(np.sqrt(N))), 32, 256))
+
+        # link forces act between distinct nodes only
+        not_loop = source != target
+        s, t = source[not_loop], target[not_loop]
+        count = np.bincount(s, minlength=N) + np.bincount(t, minlength=N)
+        link_strength = 1 / np.minimum(count[s], count[t])
+        bias = count[s] / (count[s] + count[t])
+        distance = config['link_distance'] / (1 + config['link_distance_variation'] * relative_weight[not_loop])
+
+        alpha = 1.0
+        alpha_decay = 1 - _alpha_min ** (1 / 300)
+        if iterations is None:
+            iterations = int(np.ceil(np.log(_alpha_min) / np.log(1 - alpha_decay)))
+
+        vel = np.zeros_like(pos)
+        for _ in range(iterations):
+            alpha += -alpha * alpha_decay
+
+            # links
+            if len(s) > 0:
+                d = pos[t] + vel[t] - pos[s] - vel[s]
+                l = np.sqrt((d**2).sum(axis=1))
+                coinciding = l == 0
+                d[coinciding] = _jiggle(rng, (coinciding.sum(), 2))
+                l[coinciding] = np.sqrt((d[coinciding]**2).sum(axis=1))
+                d *= ((l - distance) / l * alpha * link_strength)[:, None]
+                for k in range(2):
+                    vel[:, k] -= np.bincount(t, weights=d[:, k] * bias, minlength=N)
+                    vel[:, k] += np.bincount(s, weights=d[:, k] * (1 - bias), minlength=N)
+
+            # many-body
+            if N > 1:
+                vel += config['node_charge'] * alpha * _many_body_field(pos, grid_size)
+
+            # gravity towards the center
+            vel -= pos * config['node_gravity'] * alpha
+
+            # collision
+            if config['node_collision'] and N > 1:
+                predicted = pos + vel
+                i, j = _neighbor_pairs(predicted, 2 * radius.max())
+                d = predicted[i] - predicted[j]
+                l2 = (d**2).sum(axis=1)
+                r = radius[i] + radius[j]
+                overlapping = l2 < r**2
+                i, j, d, l2, r = i[overlapping], j[overlapping], d[overlapping], l2[overlapping], r[overlapping]
+                coinciding = l2 == 0
+                d[coinciding] = _jiggle(rng, (coinciding.sum(), 2))
+                l = np.sqrt((d**2).sum(axis=1))
+                d *= ((r - l) / l * _collision_strength)[:, None]
+                share = radius[j]**2 / (radius[i]**2 + radius[j]**2)
+                for k in range(2):
+                    vel[:, k] += np.bincount(i, weights=d[:, k] * share, minlength=N)
+                    vel[:, k] -= np.bincount(j, weights=d[:, k] * (1 - share), minlength=N)
+
+            vel *= 1 - _velocity_decay
+            pos += vel
+
+    # place the center of the layout in the middle of the canvas
+    zoom = config['zoom']
+    if N > 0:
+        center = (pos.max(axis=0) + pos.min(axis=0)) / 2
+    else:
+        center = np.zeros(2)
+    if canvas_size is None:
+        if N > 0:
+            canvas_size = 2 * ((np.abs(pos - center) * zoom).max() + radius.max() + config['node_stroke_width'])
+        else:
+            canvas_size = 1
+    if not has_positions:
+        pos += canvas_size / 2 - center
+        center = canvas_size / 2
+    canvas = (pos - center) * zoom + canvas_size / 2
+
+    colors = _node_colors(node_data, config)
+
+    network_properties = {
+        'xlim': [0, canvas_size],
+        'ylim': [0, canvas_size],
+        'linkColor': config['link_color'],
+        'linkAlpha': config['link_alpha'],
+        'nodeStrokeColor': config['node_stroke_color'],
+        'nodeStrokeWidth': config['node_stroke_width'],
+        'links': [ {'source': nodes[s], 'target': nodes[t], 'weight': w, 'width': wi}
+                   for s, t, w, wi in zip(source.tolist(), target.tolist(), weight.tolist(), width.tolist()) ],
+        'nodes': [ {'id': node,
+                    'x': x,
+                    'y': y,
+                    'x_canvas': x_canvas,
+                    'y_canvas': y_canvas,
+                    'radius': r,
+                    'color': color,
+                   }
+                   for node, (x, y), (x_canvas, y_canvas), r, color
+                   in zip(nodes, pos.tolist(), canvas.tolist(), radius.tolist(), colors) ],
+    }
+
+    return network_properties, config
@@ -4,12 +4,25 @@ import numpy as np
 import matplotlib.pyplot as pl
 import networkx as nx
 
-from netwulf.tools import bind_properties_to_network, get_filtered_network, draw_netwulf, node_pos, add_node_label, add_edge_label
-from netwulf import visualize
-from netwulf.io import save, load
+from netwulf.tools import bind_properties_to_network, get_filtered_network, draw_netwulf, node_pos, add_node_label, add_edge_label, node_positions, add_node_labels, add_edge_labels, get_thresholded_network, get_coarsened_network, get_temporal_network
+from netwulf import visualize, visualize_temporal
+from netwulf.layout import force_layout
+from netwulf.cli import render
+import netwulf.interactive
+import netwulf.io
+from netwulf.interactive import NetwulfHTTPServer, NetwulfHTTPRequestHandler, NetwulfSession
+from netwulf.io import save, load, iter_node_link_json, iter_columnar_network, read_columnar_network, save_binary, load_binary
 
 import pathlib
 import tempfile
+import socket
+import threading
+import urllib.request
+import urllib.parse
+import urllib.error
+import json
+import gzip
+from unittest import mock
 
 def _get_test_network():
     G = nx.Graph()
@@ -209,6 +222,610 @@ class Test(unittest.TestCase):
         # remove test file
         pathlib.Path(fn).unlink()
 
+    def test_concurrent_server(self):
+        """Test whether the server answers requests concurrently and stops on an empty POST."""
+        server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [])
+        thread = threading.Thread(None, server.run)
+        thread.start()
+
+        # an idle connection must not block other requests
+        idle = socket.create_connection(server.server_address)
+
+        url = "http://127.0.0.1:{}/".format(server.server_address[1])
+        request = urllib.request.Request(url, data=b'', method='POST')
+        urllib.request.urlopen(request, timeout=5).read()
+
+        thread.join(5)
+        assert(not thread.is_alive())
+        idle.close()
+        server.stop_this()
+
+    def test_in_memory_payloads(self):
+        """Test whether registered routes are served from memory."""
+        payloads = {'/data/network.json': b'{"nodes":[],"links":[]}'}
+        server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [], payloads=payloads)
+        thread = threading.Thread(None, server.run)
+        thread.start()
+
+        url = "http://127.0.0.1:{}/data/network.json?foo=bar".format(server.server_address[1])
+        body = urllib.request.urlopen(url, timeout=5).read()
+
+        server.end_requested = True
+        thread.join()
+        server.stop_this()
+
+        assert(body == payloads['/data/network.json'])
+
+    def test_package_assets(self):
+        """Test whether the web app is served from the package directory regardless of the cwd."""
+        html_source_path = netwulf.interactive.html_source_path
+        with tempfile.TemporaryDirectory() as source:
+            pathlib.Path(source, 'index.html').write_bytes(b'<html></html>')
+            netwulf.interactive.html_source_path = pathlib.Path(source)
+
+            server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [])
+            thread = threading.Thread(None, server.run)
+            thread.start()
+
+            url = "http://127.0.0.1:{}/".format(server.server_address[1])
+            try:
+                body = urllib.request.urlopen(url, timeout=5).read()
+            finally:
+                netwulf.interactive.html_source_path = html_source_path
+                server.end_requested = True
+                thread.join()
+                server.stop_this()
+
+        assert(body == b'<html></html>')
+
+    def test_session(self):
+        """Test whether a session serves several non-blocking visualizations on one server."""
+        G = _get_test_network()
+        with mock.patch('webbrowser.open') as browser:
+            session = NetwulfSession(port=0).start()
+            futures = [ session.visualize(G, config=_get_test_config()) for _ in range(2) ]
+        port = session.server.server_address[1]
+
+        # emulate the web apps which were opened
+        for future, call in zip(futures, browser.call_args_list):
+            url = call[0][0].replace(":0/", ":{}/".format(port))
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+            base = "http://127.0.0.1:{}/".format(port)
+            network = json.loads(urllib.request.urlopen(base + query['data'][0], timeout=5).read().decode())
+            config = json.loads(urllib.request.urlopen(base + query['config'][0], timeout=5).read().decode())
+            assert(not future.done())
+
+            body = json.dumps({'network': network, 'config': config, 'image': 'data:image/png;base64,'})
+            request = urllib.request.Request(base, data=body.encode(), headers={'Referer': url}, method='POST')
+            urllib.request.urlopen(request, timeout=5).read()
+
+            props, posted_config = future.result(timeout=5)
+            assert(len(props['nodes']) == G.number_of_nodes())
+            assert(posted_config['node_size'] == _get_test_config()['node_size'])
+
+        # the same server was used for both visualizations and it forgot about the served data
+        assert(session.server.payloads == {})
+        session.stop()
+        assert(not session.running)
+
+    def test_streaming_serialization(self):
+        """Test whether the streamed node-link json equals the one produced by networkx."""
+        G = nx.MultiDiGraph(_get_test_network())
+        G.add_edge("a", "b", weight=np.float64(2.0))
+        G.graph['foo'] = 'bar'
+
+        streamed = json.loads(b''.join(iter_node_link_json(G, chunk_size=16)).decode())
+        expected = nx.node_link_data(G)
+        expected['links'] = expected.pop('edges', expected.get('links'))
+
+        self.assertDictEqual(streamed, expected)
+
+        flat = json.loads(b''.join(iter_node_link_json(G, flatten_graph_attributes=True)).decode())
+        assert(flat['foo'] == 'bar')
+        assert('graph' not in flat)
+
+    def test_columnar_format(self):
+        """Test whether the binary columnar format reproduces the node-link data."""
+        G = nx.convert_node_labels_to_integers(_get_test_network())
+        for e, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = e + 1
+        nx.set_node_attributes(G, {u: 'AB'[u%2] for u in G.nodes()}, 'group')
+        G.graph['foo'] = 'bar'
+
+        network = read_columnar_network(b''.join(iter_columnar_network(G)))
+        expected = json.loads(b''.join(iter_node_link_json(G, flatten_graph_attributes=True)).decode())
+        self.assertDictEqual(network, expected)
+
+        # non-integer node ids are sent as strings
+        G = _get_test_network()
+        network = read_columnar_network(b''.join(iter_columnar_network(G)))
+        assert([ node['id'] for node in network['nodes'] ] == [ str(u) for u in G.nodes() ])
+
+    def test_compression(self):
+        """Test whether payloads and static assets are sent gzipped if the client accepts it."""
+        G = _get_test_network()
+        payloads = {
+            '/data/network.json': lambda: iter_node_link_json(G),
+            '/data/config.json': json.dumps(_get_test_config()).encode(),
+        }
+        html_source_path = netwulf.interactive.html_source_path
+        with tempfile.TemporaryDirectory() as source:
+            pathlib.Path(source, 'index.html').write_bytes(b'<html></html>')
+            netwulf.interactive.html_source_path = pathlib.Path(source)
+
+            server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [], payloads=payloads)
+            thread = threading.Thread(None, server.run)
+            thread.start()
+
+            base = "http://127.0.0.1:{}/".format(server.server_address[1])
+            bodies = []
+            try:
+                for route in ['data/network.json', 'data/config.json', 'index.html']:
+                    request = urllib.request.Request(base + route, headers={'Accept-Encoding': 'br;q=0, gzip'})
+                    response = urllib.request.urlopen(request, timeout=5)
+                    assert(response.headers['Content-Encoding'] == 'gzip')
+                    bodies.append(gzip.decompress(response.read()))
+            finally:
+                netwulf.interactive.html_source_path = html_source_path
+                server.end_requested = True
+                thread.join()
+                server.stop_this()
+
+        assert(bodies[0] == b''.join(iter_node_link_json(G)))
+        assert(bodies[1] == payloads['/data/config.json'])
+        assert(bodies[2] == b'<html></html>')
+
+    def test_image_upload(self):
+        """Test whether an image posted as raw bytes is received and oversized images are rejected."""
+        server = NetwulfHTTPServer(("127.0.0.1", 0), NetwulfHTTPRequestHandler, [])
+        thread = threading.Thread(None, server.run)
+        thread.start()
+
+        url = "http://127.0.0.1:{}/image".format(server.server_address[1])
+        image = b'\x89PNG\r\n\x1a\n' + bytes(range(256))
+        try:
+            request = urllib.request.Request(url, data=image, headers={'Content-Type': 'image/png'}, method='POST')
+            urllib.request.urlopen(request, timeout=5).read()
+            assert(server.posted_image_base64 == image)
+            # posting an image doesn't stop the server
+            assert(not server.end_requested)
+
+            with mock.patch.object(NetwulfHTTPRequestHandler, 'max_image_size', 8):
+                request = urllib.request.Request(url, data=image, headers={'Content-Type': 'image/png'}, method='POST')
+                with self.assertRaises(urllib.error.HTTPError):
+                    urllib.request.urlopen(request, timeout=5)
+        finally:
+            server.end_requested = True
+            thread.join()
+            server.stop_this()
+
+    def test_headless_layout(self):
+        """Test whether the headless layout produces properties that can be drawn and bound."""
+        G = nx.random_partition_graph([20, 20], 0.5, 0.02, seed=1)
+        nx.set_node_attributes(G, {u: G.nodes[u]['block'] for u in G.nodes()}, 'group')
+
+        props, config = force_layout(G, config=_get_test_config(), seed=1)
+        assert(len(props['nodes']) == G.number_of_nodes())
+        assert(len(props['links']) == G.number_of_edges())
+        assert(config['zoom'] == _get_test_config()['zoom'])
+
+        # all nodes are on the canvas
+        for node in props['nodes']:
+            assert(props['xlim'][0] <= node['x_canvas'] <= props['xlim'][1])
+            assert(props['ylim'][0] <= node['y_canvas'] <= props['ylim'][1])
+
+        # linked nodes are closer to each other than to the other nodes on average
+        pos = np.array([ [node['x'], node['y']] for node in props['nodes'] ])
+        index = { node['id']: i for i, node in enumerate(props['nodes']) }
+        linked = np.mean([ np.linalg.norm(pos[index[u]] - pos[index[v]]) for u, v in G.edges() ])
+        overall = np.mean([ np.linalg.norm(p - q) for p in pos for q in pos ])
+        assert(linked < overall)
+
+        # bound positions are kept fixed
+        bind_properties_to_network(G, props)
+        newprops, _ = force_layout(G, config=_get_test_config())
+        _assert_positions_within_one_percent(props, newprops)
+
+        fig, ax = draw_netwulf(props)
+        pl.close(fig)
+
+    def test_render(self):
+        """Test whether saved visualizations and graph files are rendered in parallel with per-file errors."""
+        with tempfile.TemporaryDirectory() as directory:
+            directory = pathlib.Path(directory)
+            files = []
+            for seed in range(3):
+                G = nx.barabasi_albert_graph(50, 2, seed=seed)
+                props, config = force_layout(G, seed=seed)
+                files.append(str(directory / 'saved_{}.json'.format(seed)))
+                save(files[-1], props, config, G)
+            files.append(str(directory / 'graph.graphml'))
+            nx.write_graphml(_get_test_network(), files[-1])
+            files.append(str(directory / 'broken.json'))
+            pathlib.Path(files[-1]).write_text('{')
+
+            results = render(files, output_dir=str(directory / 'out'), jobs=2, verbose=False)
+
+            errors = { pathlib.Path(path).name: error for path, _, error, _ in results }
+            assert(errors.pop('broken.json') is not None)
+            assert(all(error is None for error in errors.values()))
+            for path, output, error, _ in results:
+                assert(pathlib.Path(output).exists() == (error is None))
+
+    def test_drawn_segments(self):
+        """Test whether the drawn link segments connect the drawn node positions."""
+        G = _get_test_network()
+        props, _ = force_layout(G, seed=1)
+        props['links'][0]['color'] = '#ff0000'
+
+        fig, ax = draw_netwulf(props, rasterize_links=True)
+        links, nodes = ax.collections
+
+        height = props['ylim'][1] - props['ylim'][0]
+        pos = { node['id']: (node['x_canvas'], height - node['y_canvas']) for node in props['nodes'] }
+        for segment, link in zip(links.get_segments(), props['links']):
+            assert(np.allclose(segment, [pos[link['source']], pos[link['target']]]))
+        assert(np.allclose(nodes.get_offsets(), list(pos.values())))
+        assert(links.get_rasterized())
+        assert(np.allclose(links.get_colors()[0][:3], [1, 0, 0]))
+        pl.close(fig)
+
+    def test_node_index(self):
+        """Test whether node positions are found by the cached index, also after the node list changed."""
+        props, _ = force_layout(_get_test_network(), seed=1)
+        ids = [ node['id'] for node in props['nodes'] ]
+
+        XY = node_positions(props, ids[::-1])
+        for node_id, xy in zip(ids[::-1], XY):
+            assert(np.allclose(node_pos(props, node_id), xy))
+
+        # change the node list in place
+        props['nodes'].reverse()
+        props['nodes'][0]['x_canvas'] += 1
+        assert(np.allclose(node_positions(props, [ids[-1]])[0], XY[0] + [1, 0]))
+
+        props['nodes'].append(dict(props['nodes'][0], id='new'))
+        assert(np.allclose(node_pos(props, 'new'), node_pos(props, ids[-1])))
+
+        with self.assertRaises(KeyError):
+            node_positions(props, ['does not exist'])
+
+    def test_bulk_labels(self):
+        """Test whether bulk labels are placed like single labels."""
+        G = _get_test_network()
+        props, _ = force_layout(G, seed=1)
+        fig, ax = draw_netwulf(props)
+
+        add_node_label(ax, props, 'a')
+        add_edge_label(ax, props, ('a', 'b'), dscale=0.25)
+        single_node, single_edge = ax.texts
+
+        node_texts = add_node_labels(ax, props, G.nodes())
+        edge_texts = add_edge_labels(ax, props, G.edges(), labels=['x', 'y'], dscale=0.25)
+
+        assert(len(node_texts) == G.number_of_nodes())
+        assert([ t.get_text() for t in node_texts ] == [ str(u) for u in G.nodes() ])
+        assert([ t.get_text() for t in edge_texts ] == ['x', 'y'])
+        assert(len({ t.get_zorder() for t in node_texts }) == 1)
+
+        edge_texts += add_edge_labels(ax, props, [('a', 'b')], dscale=0.25)
+        node_text = node_texts[list(G.nodes()).index('a')]
+        assert(edge_texts[-1].get_text() == single_edge.get_text())
+        assert(np.allclose(node_text.get_position(), single_node.get_position()))
+        assert(np.allclose(edge_texts[-1].get_position(), single_edge.get_position()))
+        pl.close(fig)
+
+    def test_bind_properties(self):
+        """Test binding properties to multigraphs and as columns."""
+        G = nx.MultiGraph()
+        G.add_edges_from([('a', 'b'), ('a', 'b'), ('b', 'c')])
+        props, _ = force_layout(G, seed=1)
+        props['links'][1]['width'] = 7.0
+
+        columns = bind_properties_to_network(G, props, as_columns=True)
+        assert('x' not in G.nodes['a'])
+        assert('rescale' not in G.graph)
+        assert(columns['nodes']['id'] == list(G.nodes()))
+        assert(np.allclose(columns['nodes']['x'], [ n['x'] for n in props['nodes'] ]))
+        assert(columns['links']['key'] == [0, 1, 0])
+        assert(columns['graph']['linkColor'] == props['linkColor'])
+
+        bind_properties_to_network(G, props)
+        assert(G.graph['rescale'] is False)
+        assert(G.nodes['c']['radius'] == props['nodes'][2]['radius'])
+        assert(G.edges['a', 'b', 1]['width'] == 7.0)
+        assert(G.edges['b', 'a', 0]['width'] == props['links'][0]['width'])
+
+        props['links'][0]['key'] = 1
+        props['links'][0]['width'] = 3.0
+        bind_properties_to_network(G, props, bind_node_positions=False)
+        assert(G.edges['a', 'b', 1]['width'] == 3.0)
+
+    def test_filtered_view(self):
+        """Test whether filtered views serialize like filtered copies without changing the network."""
+        for graph_class in [nx.Graph, nx.DiGraph]:
+            G = graph_class(_get_test_network())
+            for e, (u, v) in enumerate(G.edges()):
+                G[u][v]['foo'] = e
+                G[u][v]['bar'] = -e
+            nx.set_node_attributes(G, { u: 'AB'[i%2] for i, u in enumerate(G.nodes()) }, 'wum')
+
+            for kwargs in [{'edge_weight_key': 'foo'}, {'node_group_key': 'wum'},
+                           {'edge_weight_key': 'bar', 'node_group_key': 'wum'}]:
+                copied = get_filtered_network(G, **kwargs)
+                view = get_filtered_network(G, as_view=True, **kwargs)
+                assert(nx.is_frozen(view))
+                assert(b''.join(iter_node_link_json(view)) == b''.join(iter_node_link_json(copied)))
+                assert(read_columnar_network(b''.join(iter_columnar_network(view))) ==
+                       read_columnar_network(b''.join(iter_columnar_network(copied))))
+                assert(view.number_of_edges() == G.number_of_edges())
+
+            assert(G.nodes['a']['wum'] == 'A')
+            assert('group' not in G.nodes['a'])
+            assert(G.edges['a', 'b']['bar'] == -G.edges['a', 'b']['foo'])
+
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, foo=1, bar=2)
+        G.add_edge(0, 1, foo=3, bar=4)
+        view = get_filtered_network(G, edge_weight_key='foo', as_view=True)
+        assert(list(view.edges(keys=True, data=True)) == [(0, 1, 0, {'weight': 1}), (0, 1, 1, {'weight': 3})])
+        assert(G.edges[0, 1, 1] == {'foo': 3, 'bar': 4})
+
+    def test_binary_format(self):
+        """Test whether visualizations saved in the binary format are loaded unchanged."""
+        G = _get_test_network()
+        props, config = force_layout(G, seed=1)
+        props['nodes'][0]['label'] = 'first'
+        props['links'][0]['color'] = '#123456'
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(pathlib.Path(directory) / 'network.nwlb')
+            save_binary(path, props, config, G)
+
+            for loaded in [load_binary(path), load(path)]:
+                assert(loaded[0] == props)
+                assert(loaded[1] == config)
+                assert(nx.utils.graphs_equal(loaded[2], G))
+
+            arrays, _, _ = load_binary(path, as_arrays=True)
+            assert(isinstance(arrays['nodes']['x'], np.ndarray))
+            assert(np.array_equal(arrays['nodes']['x'], [ n['x'] for n in props['nodes'] ]))
+            assert(list(arrays['nodes']['id']) == list(G.nodes()))
+            assert(list(arrays['nodes']['label']) == ['first', None, None, None])
+            assert(list(arrays['links']['source']) == [ list(G.nodes()).index(l['source']) for l in props['links'] ])
+            del arrays
+
+            with open(path, 'rb') as f:
+                assert(load_binary(f)[0] == props)
+
+            with tempfile.TemporaryFile() as f:
+                save_binary(f, props, config)
+                f.seek(0)
+                assert(load_binary(f) == (props, config, None))
+
+    def test_partial_load(self):
+        """Test loading parts of saved visualizations, incrementally or not."""
+        G = nx.MultiDiGraph(_get_test_network())
+        G.add_edge('a', 'b', weight=2)
+        G.graph['note'] = 'brackets ]}[{ and "quotes"'
+        props, config = force_layout(G, seed=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(pathlib.Path(directory) / 'network.json')
+            save(path, props, config, G)
+            binary_path = str(pathlib.Path(directory) / 'network.nwlb')
+            save_binary(binary_path, props, config, G)
+
+            full = load(path)
+
+            # read with tiny chunks to hit every chunk boundary
+            with mock.patch.object(netwulf.io._JSONStream.__init__, '__defaults__', (3,)):
+                incremental = load(path, incremental=True)
+            assert(incremental[:2] == full[:2])
+            assert(nx.utils.graphs_equal(incremental[2], G))
+            assert(type(incremental[2]) == nx.MultiDiGraph)
+
+            for f in [path, binary_path]:
+                for incremental in [False, True]:
+                    loaded = load(f, parts=['stylized_network'], incremental=incremental)
+                    assert(loaded == (full[0], None, None))
+                    loaded = load(f, parts=('config', 'Graph'), incremental=incremental)
+                    assert(loaded[:2] == (None, config))
+                    assert(nx.utils.graphs_equal(loaded[2], G))
+
+            with self.assertRaises(ValueError):
+                load(path, parts=['positions'])
+
+    def test_compressed_files(self):
+        """Test whether compressed visualizations are loaded unchanged."""
+        G = _get_test_network()
+        props, config = force_layout(G, seed=1)
+
+        methods = ['gzip', 'bz2', 'xz'] + (['zstd'] if netwulf.io.zstandard is not None else [])
+        extensions = { method: extension for extension, method in netwulf.io._compression_extensions.items() }
+
+        with tempfile.TemporaryDirectory() as directory:
+            for method in methods:
+                path = str(pathlib.Path(directory) / ('network.json' + extensions[method]))
+                save(path, props, config, G)
+                with open(path, 'rb') as f:
+                    assert(netwulf.io._compression_method(path, 'infer', f.read(6))[0] == method)
+                for incremental in [False, True]:
+                    loaded = load(path, incremental=incremental)
+                    assert(loaded[:2] == (props, config))
+                    assert(nx.utils.graphs_equal(loaded[2], G))
+
+                # explicit compression regardless of the extension
+                path = str(pathlib.Path(directory) / 'network.json')
+                save(path, props, config, compression={'method': method})
+                assert(load(path) == (props, config, None))
+                assert(load(path, compression=method) == (props, config, None))
+
+            path = str(pathlib.Path(directory) / 'network.json.gz')
+            save(path, props, config, compression=None)
+            assert(load(path) == (props, config, None))
+
+            with self.assertRaises(ValueError):
+                save(path, props, config, compression='rar')
+
+    def test_thresholding(self):
+        """Test whether link weight thresholds are applied in Python like in the web app."""
+        G = nx.path_graph(11)
+        for u, v in G.edges():
+            G[u][v]['weight'] = 10 - u
+        G.add_node('singleton')
+        config = {'min_link_weight_percentile': 0.25,
+                  'max_link_weight_percentile': 0.8,
+                  'display_singleton_nodes': False,
+                  }
+
+        # ranks floor(0.25*9) = 2 and floor(0.8*9) = 7 of the sorted weights 1, ..., 10
+        shown, withheld = get_thresholded_network(G, config)
+        assert(sorted(d['weight'] for _, _, d in shown.edges(data=True)) == list(range(3, 9)))
+        assert(sorted(d['weight'] for _, _, d in withheld.edges(data=True)) == [1, 2, 9, 10])
+        assert(set(shown.nodes()) == set(range(2, 9)))
+        assert(withheld.number_of_nodes() == G.number_of_nodes())
+
+        shown, withheld = get_thresholded_network(G)
+        assert(shown is G)
+        assert(withheld.number_of_edges() == 0)
+
+        payloads, query = netwulf.interactive._prepare_payloads(G, config, 'test', apply_thresholds=True)
+        assert('&withheld=data/withheld_test.json' in query)
+        network = json.loads(b''.join(payloads['/data/network_test.json']()))
+        withheld = json.loads(b''.join(payloads['/data/withheld_test.json']()))
+        assert(len(network['links']) == 6)
+        assert(len(withheld['links']) == 4)
+        assert(sorted(map(str, (n['id'] for n in network['nodes'] + withheld['nodes']))) ==
+               sorted(map(str, G.nodes())))
+
+        props, _ = force_layout(G, config=config, seed=1)
+        assert(len(props['nodes']) == 7)
+        assert(len(props['links']) == 6)
+
+    def test_coarsening(self):
+        """Test whether nodes are aggregated to supernodes whose subgraphs are served."""
+        G = nx.Graph()
+        G.add_edges_from([(0, 1), (1, 2), (0, 2), (3, 4), (4, 5), (3, 5)], weight=2)
+        G.add_edge(2, 3, weight=0.5)
+        G.add_edge(0, 5)
+        nx.set_node_attributes(G, { u: 'AB'[u//3] for u in G }, 'group')
+
+        coarse, members = get_coarsened_network(G)
+        assert(members == [[0, 1, 2], [3, 4, 5]])
+        assert(dict(coarse.nodes(data=True)) == {
+                    0: {'group': 'A', 'size': 3, 'internal_weight': 6.0},
+                    1: {'group': 'B', 'size': 3, 'internal_weight': 6.0},
+                })
+        assert(list(coarse.edges(data='weight')) == [(0, 1, 1.5)])
+
+        # without groups, the two triangles are found by label propagation
+        coarse, members = get_coarsened_network(G, node_group_key=None, seed=1)
+        assert(sorted(members) == [[0, 1, 2], [3, 4, 5]])
+
+        # supernodes of supernodes
+        G = nx.disjoint_union_all([nx.complete_graph(4)] * 50)
+        coarse, members = get_coarsened_network(G, node_group_key=None, max_supernodes=100, seed=1)
+        assert(coarse.number_of_nodes() <= 100)
+        assert(sorted(sum(members, [])) == list(G.nodes()))
+
+        G = nx.path_graph(4)
+        nx.set_node_attributes(G, { u: u//2 for u in G }, 'group')
+        payloads, query = netwulf.interactive._prepare_payloads(G, None, 'test', coarsen=True)
+        network = json.loads(b''.join(payloads['/data/network_test.json']()))
+        assert([ node['size'] for node in network['nodes'] ] == [2, 2])
+        subgraph = json.loads(b''.join(payloads['/' + network['nodes'][1]['subgraph']]()))
+        assert([ node['id'] for node in subgraph['nodes'] ] == [2, 3])
+        assert(len(subgraph['links']) == 1)
+
+    def test_live_updates(self):
+        """Test whether changes pushed to a visualization are streamed as server-sent events."""
+        G = _get_test_network()
+        with mock.patch('webbrowser.open') as browser:
+            session = NetwulfSession(port=0).start()
+            future = session.visualize(G)
+        port = session.server.server_address[1]
+        url = browser.call_args[0][0].replace(":0/", ":{}/".format(port))
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+        base = "http://127.0.0.1:{}/".format(port)
+
+        try:
+            session.update(future, nodes=[('c', {'group': 1})], links=[('a', 'c')])
+            stream = urllib.request.urlopen(base + query['updates'][0] + '?id=' + query['id'][0], timeout=5)
+            assert(stream.headers['Content-Type'] == 'text/event-stream')
+            session.update(future, removed_nodes=['c'], removed_links=[('a', 'b')])
+
+            events = []
+            while len(events) < 2:
+                line = stream.readline().decode().strip()
+                if line.startswith('data: '):
+                    events.append(json.loads(line[6:]))
+            assert(events[0] == {'nodes': [{'id': 'c', 'group': 1}], 'links': [{'source': 'a', 'target': 'c'}]})
+            assert(events[1] == {'removed_nodes': ['c'], 'removed_links': [{'source': 'a', 'target': 'b'}]})
+
+            # a reconnecting client only gets the events it missed
+            request = urllib.request.Request(base + 'updates?id=' + query['id'][0], headers={'Last-Event-ID': '1'})
+            reconnected = urllib.request.urlopen(request, timeout=5)
+            lines = [ reconnected.readline().decode().strip() for _ in range(2) ]
+            assert(lines[0] == 'id: 2')
+
+            # the streams end with the visualization
+            request = urllib.request.Request(base, data=b'', headers={'Referer': url}, method='POST')
+            urllib.request.urlopen(request, timeout=5).read()
+            assert(future.result(timeout=5) == (None, None))
+            stream.read()
+            with self.assertRaises(ValueError):
+                session.update(future, nodes=['d'])
+        finally:
+            session.stop()
+
+    def test_temporal(self):
+        """Test whether snapshots are sent as deltas of their union and posted positions are returned per frame."""
+        snapshots = [nx.Graph([(0, 1), (1, 2)]), nx.Graph([(2, 1), (2, 3)]), nx.Graph([(0, 1)])]
+        snapshots[2].add_node(4, group=1)
+        union, frames = get_temporal_network(snapshots, times=[10, 20, 30])
+
+        nodes, links = list(union.nodes()), list(union.edges())
+        assert(nodes == [0, 1, 2, 3, 4])
+        assert(union.nodes[4]['group'] == 1)
+        assert([ frame['time'] for frame in frames ] == [10, 20, 30])
+
+        # replaying the deltas yields the snapshots
+        active_nodes, active_links = set(), set()
+        for frame, snapshot in zip(frames, snapshots):
+            active_nodes = (active_nodes | set(frame['added_nodes'])) - set(frame['removed_nodes'])
+            active_links = (active_links | set(frame['added_links'])) - set(frame['removed_links'])
+            assert({ nodes[i] for i in active_nodes } == set(snapshot.nodes()))
+            assert({ frozenset(links[i]) for i in active_links } == set(map(frozenset, snapshot.edges())))
+        assert(frames[2]['added_links'] == [links.index((0, 1))])
+
+        with mock.patch('webbrowser.open') as browser:
+            session = NetwulfSession(port=0).start()
+            with mock.patch.object(netwulf.interactive, '_session', session):
+                future = visualize_temporal(snapshots, block=False)
+        port = session.server.server_address[1]
+        url = browser.call_args[0][0].replace(":0/", ":{}/".format(port))
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+        base = "http://127.0.0.1:{}/".format(port)
+
+        try:
+            served = json.loads(urllib.request.urlopen(base + query['frames'][0], timeout=5).read().decode())
+            assert(served == get_temporal_network(snapshots)[1])
+            network = json.loads(urllib.request.urlopen(base + query['data'][0], timeout=5).read().decode())
+            assert(len(network['nodes']) == 5 and len(network['links']) == 3)
+
+            network['nodes'] = [ dict(node, x=float(i), y=0.0) for i, node in enumerate(network['nodes']) ]
+            network['frames'] = [ [ [i + t, t] for i in range(5) ] for t in range(3) ]
+            body = json.dumps({'network': network, 'config': {}})
+            request = urllib.request.Request(base, data=body.encode(), headers={'Referer': url}, method='POST')
+            urllib.request.urlopen(request, timeout=5).read()
+
+            props, config, positions = future.result(timeout=5)
+            assert(positions.shape == (3, 5, 2))
+            assert(positions[2, 4].tolist() == [6, 2])
+        finally:
+            session.stop()
+
     def test_dict(self):
 
         props, config = visualize({'nodes':[{'id':0},{'id':1},{'id':2},{'id':3}],'links':[{'source':0, 'target':1}]},is_test=True)
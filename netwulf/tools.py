@@ -2,6 +2,9 @@
 Some useful things to tweak and reproduce the visualizations.
 """
 
+from collections import OrderedDict
+from collections.abc import Mapping
+
 import numpy as np
 import networkx as nx
 
@@ -9,6 +12,50 @@ import matplotlib as mpl
 import matplotlib.pyplot as pl
 from matplotlib.collections import LineCollection, EllipseCollection
 
+class _NodeIndex(object):
+    """
+    Maps node ids to their index position in a node list of a
+    stylized network. Rebuilds itself if the node list changed.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self._build()
+
+    def _build(self):
+        self.length = len(self.nodes)
+        self.index = { node['id']: i for i, node in enumerate(self.nodes) }
+
+    def get(self, node_id):
+        """Get the node's index position or `None` if it's not in the node list."""
+        if len(self.nodes) != self.length:
+            self._build()
+        i = self.index.get(node_id)
+        if i is None or self.nodes[i]['id'] != node_id:
+            # the node list might have been changed in place
+            self._build()
+            i = self.index.get(node_id)
+        return i
+
+# indices of the most recently used node lists, keyed by the lists' ids
+# (each index keeps its node list alive, so ids can't be reused while cached)
+_node_indices = OrderedDict()
+_max_cached_node_indices = 8
+
+def _node_index(network_properties):
+    """Get the (cached) node index of a stylized network."""
+    nodes = network_properties['nodes']
+    key = id(nodes)
+    node_index = _node_indices.get(key)
+    if node_index is None or node_index.nodes is not nodes:
+        node_index = _NodeIndex(nodes)
+        _node_indices[key] = node_index
+        if len(_node_indices) > _max_cached_node_indices:
+            _node_indices.popitem(last=False)
+    else:
+        _node_indices.move_to_end(key)
+    return node_index
+
 def _get_node_index(network_properties,node_id):
     """
     Get the node's index position in the node list of the
@@ -34,14 +81,7 @@ def _get_node_index(network_properties,node_id):
         >>> i = _get_node_index(props, 0)
     """
 
-    N = len(network_properties['nodes'])
-    for index, node in enumerate(network_properties['nodes']):
-        if node_id == node['id']:
-            break
-        elif index == N-1:
-            index = None
-
-    return index
+    return _node_index(network_properties).get(node_id)
 
 
 def node_pos(network_properties,node_id):
@@ -76,6 +116,45 @@ def node_pos(network_properties,node_id):
 
     return node['x_canvas'], height - node['y_canvas']
 
+def node_positions(network_properties,node_ids):
+    """
+    Get the positions of many nodes in matplotlib data coordinates.
+    
+    Parameters
+    ----------
+    network_properties : dict
+        The network properties which are returned from the
+        interactive visualization.
+    node_ids : iterable of str or int
+        The nodes of which to get the positions
+
+    Returns
+    -------
+    XY : numpy.ndarray of shape (k, 2)
+        The x- and y-positions in matplotlib data coordinates
+
+    Example
+    -------
+        >>> props, _ = visualize(G)
+        >>> node_positions(props, [0, 1, 2])
+    """
+
+    node_index = _node_index(network_properties)
+    nodes = network_properties['nodes']
+
+    XY = []
+    for node_id in node_ids:
+        index = node_index.get(node_id)
+        if index is None:
+            raise KeyError(node_id)
+        XY.append([nodes[index]['x_canvas'], nodes[index]['y_canvas']])
+
+    height = network_properties['ylim'][1] - network_properties['ylim'][0]
+    XY = np.array(XY, dtype=float).reshape(-1, 2)
+    XY[:,1] = height - XY[:,1]
+
+    return XY
+
 def add_node_label(ax,
                    network_properties,
                    node_id,
@@ -127,6 +206,66 @@ def add_node_label(ax,
     zorder = max( _c.get_zorder() for _c in ax.get_children()) + 1
     ax.text(pos[0]+dx,pos[1]+dy,label,ha=ha,va=va,zorder=zorder,**kwargs)
 
+def add_node_labels(ax,
+                    network_properties,
+                    node_ids,
+                    labels=None,
+                    dx=0,
+                    dy=0,
+                    ha='center',
+                    va='center',
+                    **kwargs):
+    """
+    Add labels to many nodes in the drawn matplotlib axis at once.
+    Positions and the labels' zorder are computed only once, such that
+    labelling all nodes of a large network is fast, contrary to calling
+    :mod:`netwulf.tools.add_node_label` for each of them.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axis
+        The Axis object which has been used to draw the network
+    network_properties : dict
+        The network properties which are returned from the
+        interactive visualization.
+    node_ids : iterable of str or int
+        The focal nodes' ids in the `network_properties` dict
+    labels : iterable of str, default : None
+        The texts to write at the nodes' positions
+        If `None`, the values of `node_ids` will be put there.
+    dx : float, default : 0.0
+        Label offset in x-direction
+    dy : float, default : 0.0
+        Label offset in y-direction
+    ha : str, default : 'center'
+        Horizontal anchor orientation of the texts
+    va : str, default : 'center'
+        Vertical anchor orientation of the texts
+    **kwargs : dict
+        Additional styling arguments forwarded to Axis.text
+
+    Returns
+    -------
+    texts : list of matplotlib.text.Text
+        The added labels
+
+    Example
+    -------
+        >>> netw, _ = netwulf.visualize(G)
+        >>> fig, ax = netwulf.draw_netwulf(netw)
+        >>> netwulf.add_node_labels(ax,netw,G.nodes())
+    """
+
+    node_ids = list(node_ids)
+    XY = node_positions(network_properties, node_ids)
+
+    if labels is None:
+        labels = [ str(node_id) for node_id in node_ids ]
+
+    zorder = max( _c.get_zorder() for _c in ax.get_children()) + 1
+    return [ ax.text(x+dx,y+dy,label,ha=ha,va=va,zorder=zorder,**kwargs)
+             for (x, y), label in zip(XY.tolist(), labels) ]
+
 def add_edge_label(ax,
                    network_properties,
                    edge,
@@ -186,6 +325,72 @@ def add_edge_label(ax,
     pos = v0 + dscale * e 
     ax.text(pos[0]+dx,pos[1]+dy,label,ha=ha,va=va,**kwargs)
 
+def add_edge_labels(ax,
+                    network_properties,
+                    edges,
+                    labels=None,
+                    dscale=0.5,
+                    dx=0,
+                    dy=0,
+                    ha='center',
+                    va='center',
+                    **kwargs):
+    """
+    Add labels to many edges in the drawn matplotlib axis at once.
+    Positions are computed in one go, which is much faster than calling
+    :mod:`netwulf.tools.add_edge_label` for each edge.
+
+    Parameters
+    ----------
+    ax : matplotlib.Axis
+        The Axis object which has been used to draw the network
+    network_properties : dict
+        The network properties which are returned from the
+        interactive visualization.
+    edges : iterable of 2-tuples of str or int
+        The edges' node ids
+    labels : iterable of str, default : None
+        The texts to write at the edges' positions
+        If `None`, the tuples of node ids in `edges` will be put there.
+    dscale : float, default : 0.5
+        At which position between the two nodes to put the labels
+        (``dscale = 0.0`` refers to the position of node ``edge[0]``
+        and ``dscale = 1.0`` refers to the position of node ``edge[1]``,
+        so use any number between 0.0 and 1.0).
+    dx : float, default : 0.0
+        Additional label offset in x-direction
+    dy : float, default : 0.0
+        Additional label offset in y-direction
+    ha : str, default : 'center'
+        Horizontal anchor orientation of the texts
+    va : str, default : 'center'
+        Vertical anchor orientation of the texts
+    **kwargs : dict
+        Additional styling arguments forwarded to Axis.text
+
+    Returns
+    -------
+    texts : list of matplotlib.text.Text
+        The added labels
+
+    Example
+    -------
+        >>> netw, _ = netwulf.visualize(G)
+        >>> fig, ax = netwulf.draw_netwulf(netw)
+        >>> netwulf.add_edge_labels(ax,netw,G.edges())
+    """
+
+    edges = [ tuple(edge[:2]) for edge in edges ]
+    v0 = node_positions(network_properties, [ u for u, _ in edges ])
+    v1 = node_positions(network_properties, [ v for _, v in edges ])
+    pos = v0 + dscale * (v1-v0)
+
+    if labels is None:
+        labels = [ "("+str(u)+", "+str(v)+")" for u, v in edges ]
+
+    return [ ax.text(x+dx,y+dy,label,ha=ha,va=va,**kwargs)
+             for (x, y), label in zip(pos.tolist(), labels) ]
+
 def bind_properties_to_network(network,
                                network_properties,
                                bind_node_positions=True,
@@ -195,9 +400,12 @@ def bind_properties_to_network(network,
                                bind_node_stroke_width=True,
                                bind_link_width=True,
                                bind_link_color=True,
-                               bind_link_alpha=True):
+                               bind_link_alpha=True,
+                               as_columns=False):
     """
     Binds calculated positional values to the network as node attributes `x` and `y`.
+    All selected node and link properties are bound in a single sweep
+    over the nodes and links, respectively.
 
     Parameters
     ----------
@@ -214,42 +422,542 @@ def bind_properties_to_network(network,
     bind_link_width : bool (default: True)
     bind_link_color : bool (default: True)
     bind_link_alpha : bool (default: True)
+    as_columns : bool (default: False)
+        If ``True``, the network is left untouched and the selected
+        properties are returned as columns instead.
+
+    Returns
+    -------
+    columns : dict
+        Only if ``as_columns = True``. Has entries ``'nodes'`` and
+        ``'links'`` which map attribute names to columns (numerical
+        attributes are numpy arrays, ids and colors are lists) and
+        an entry ``'graph'`` with the global style properties.
+        For multigraphs, the links have a column ``'key'``.
+
+    Notes
+    -----
+    For multigraphs, a link is bound to the edge given by its ``'key'``.
+    Links without a key are bound to the parallel edges between
+    their nodes in the order in which the network iterates them.
 
     Example
     -------
         >>> props, _ = netwulf.visualize(G)
         >>> netwulf.bind_properties_to_network(G, props)
     """
-    # Add individial node attributes
+    nodes = network_properties['nodes']
+    links = network_properties['links']
+
+    node_keys = []
     if bind_node_positions:
-        x = { node['id']: node['x'] for node in network_properties['nodes'] }
-        y = { node['id']: node['y'] for node in network_properties['nodes'] }
-        nx.set_node_attributes(network, x, 'x')
-        nx.set_node_attributes(network, y, 'y')
-        network.graph['rescale'] = False
+        node_keys += ['x', 'y']
     if bind_node_color:
-        color = { node['id']: node['color'] for node in network_properties['nodes'] }
-        nx.set_node_attributes(network, color, 'color')
+        node_keys.append('color')
     if bind_node_radius:
-        radius = { node['id']: node['radius'] for node in network_properties['nodes'] }
-        nx.set_node_attributes(network, radius, 'radius')
+        node_keys.append('radius')
+    link_keys = ['width'] if bind_link_width else []
+
+    # Global style properties
+    graph = {}
+    if bind_node_positions:
+        graph['rescale'] = False
+    for key, bind in [
+                ('nodeStrokeColor', bind_node_stroke_color),
+                ('nodeStrokeWidth', bind_node_stroke_width),
+                ('linkColor', bind_link_color),
+                ('linkAlpha', bind_link_alpha),
+            ]:
+        if bind:
+            graph[key] = network_properties[key]
+
+    multigraph = network.is_multigraph()
+
+    if as_columns:
+        node_columns = _columns(nodes, ['id'] + node_keys, ['x', 'y', 'radius'])
+        link_columns = _columns(links, ['source', 'target'] + link_keys, ['width'])
+        if multigraph:
+            link_columns['key'] = [ key for _, _, key in _link_edges(network, links) ]
+        return {'nodes': node_columns, 'links': link_columns, 'graph': graph}
+
+    # Add individial node attributes
+    if node_keys:
+        node_attributes = network.nodes
+        for node in nodes:
+            try:
+                attributes = node_attributes[node['id']]
+            except KeyError:
+                continue
+            for key in node_keys:
+                attributes[key] = node[key]
 
     # Add individual link attributes
-    if bind_link_width:
-        width = { (link['source'], link['target']): link['width'] for link in network_properties['links'] }
-        nx.set_edge_attributes(network, width, 'width')
-
-    # Add global style properties
-    if bind_node_stroke_color:
-        network.graph['nodeStrokeColor'] = network_properties['nodeStrokeColor']
-    if bind_node_stroke_width:
-        network.graph['nodeStrokeWidth'] = network_properties['nodeStrokeWidth']
-    if bind_link_color:
-        network.graph['linkColor'] = network_properties['linkColor']
-    if bind_link_alpha:
-        network.graph['linkAlpha'] = network_properties['linkAlpha']
-
-def get_filtered_network(network,edge_weight_key=None,node_group_key=None):
+    if link_keys:
+        for link, data, _ in _link_edges(network, links):
+            if data is None:
+                continue
+            for key in link_keys:
+                data[key] = link[key]
+
+    network.graph.update(graph)
+
+def _columns(items, keys, numerical_keys):
+    """Turn a list of dicts into columns of the values at ``keys`` in a single pass."""
+    columns = dict(zip(keys, ([] for _ in keys)))
+    appends = [ columns[key].append for key in keys ]
+    for item in items:
+        for append, key in zip(appends, keys):
+            append(item[key])
+    for key in keys:
+        if key in numerical_keys:
+            columns[key] = np.array(columns[key], dtype=float)
+    return columns
+
+def _link_edges(network, links):
+    """
+    Yield a tuple ``(link, edge_data, key)`` for each link in ``links``, where
+    ``edge_data`` is the attribute dictionary of the network's edge
+    (``None`` if the edge doesn't exist) and ``key`` is the edge's key in
+    a multigraph (``None`` otherwise).
+    """
+    adjacency = network.adj
+    multigraph = network.is_multigraph()
+    directed = network.is_directed()
+
+    # iterators over parallel edges for links without keys
+    parallel = {}
+
+    for link in links:
+        u, v = link['source'], link['target']
+        try:
+            data = adjacency[u][v]
+        except KeyError:
+            yield link, None, None
+            continue
+
+        if not multigraph:
+            yield link, data, None
+        elif 'key' in link:
+            yield link, data.get(link['key']), link['key']
+        else:
+            try:
+                edges = parallel[(u, v)]
+            except KeyError:
+                edges = iter(list(data.items()))
+                parallel[(u, v)] = edges
+                if not directed:
+                    parallel[(v, u)] = edges
+            key, data = next(edges, (None, None))
+            yield link, data, key
+
+class _ProjectedAtlas(Mapping):
+    """
+    Read-only mapping which passes the values of another
+    mapping through ``project`` on access.
+    """
+
+    __slots__ = ('_atlas', '_project')
+
+    def __init__(self, atlas, project):
+        self._atlas = atlas
+        self._project = project
+
+    def __len__(self):
+        return len(self._atlas)
+
+    def __iter__(self):
+        return iter(self._atlas)
+
+    def __contains__(self, key):
+        return key in self._atlas
+
+    def __getitem__(self, key):
+        return self._project(self._atlas[key])
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, dict(self))
+
+def _filtered_view(network, project_node, project_edge):
+    """
+    Get a frozen graph view of ``network`` in the manner of
+    ``nx.subgraph_view`` which projects the attribute dictionaries
+    of nodes and edges on access, without copying them.
+    """
+
+    G = nx.freeze(network.__class__())
+    G._graph = network
+    G.graph = network.graph
+
+    G._node = network._node
+    if project_node is not None:
+        G._node = _ProjectedAtlas(network._node, project_node)
+
+    if project_edge is None:
+        project = None
+    elif network.is_multigraph():
+        project = lambda nbrs: _ProjectedAtlas(nbrs, lambda keydict: _ProjectedAtlas(keydict, project_edge))
+    else:
+        project = lambda nbrs: _ProjectedAtlas(nbrs, project_edge)
+
+    def project_adjacency(adj):
+        if project is None:
+            return adj
+        return _ProjectedAtlas(adj, project)
+
+    if network.is_directed():
+        G._succ = G._adj = project_adjacency(network._succ)
+        G._pred = project_adjacency(network._pred)
+    else:
+        G._adj = project_adjacency(network._adj)
+
+    return G
+
+def _link_weight_bounds(weights, min_percentile, max_percentile):
+    """
+    Get the weights at the percentile ranks ``floor(percentile * (M-1))``
+    of the ascendingly sorted link weights, selecting them
+    with ``numpy.partition`` instead of sorting all weights.
+    """
+    M = len(weights)
+    if M == 0:
+        return -np.inf, np.inf
+    ranks = [ min(max(int(np.floor(p * (M-1))), 0), M-1) for p in (min_percentile, max_percentile) ]
+    partitioned = np.partition(weights, ranks)
+    return partitioned[ranks[0]], partitioned[ranks[1]]
+
+def get_thresholded_network(network, config=None):
+    """
+    Apply the thresholding of the interactive visualization to a network,
+    i.e. only keep the links whose weight lies between the
+    ``'min_link_weight_percentile'`` and the ``'max_link_weight_percentile'``
+    of all link weights (links without a ``'weight'`` count as having
+    weight 1) and, if ``'display_singleton_nodes'`` is ``False``,
+    remove the nodes without any remaining link.
+
+    Parameters
+    ----------
+    network : networkx.Graph or alike
+        The network to threshold
+    config : dict, default : None
+        Visualization config with the thresholding keys (missing ones
+        are taken from :mod:`netwulf.interactive.default_config`).
+
+    Returns
+    -------
+    shown : networkx.Graph or alike
+        A read-only view of the network with the nodes and links that
+        pass the thresholds (the network itself if everything passes).
+    withheld : networkx.Graph or alike
+        A read-only view of the network with all nodes and
+        the links that don't pass the thresholds.
+
+    Example
+    -------
+        >>> shown, withheld = netwulf.get_thresholded_network(G, {'min_link_weight_percentile': 0.9})
+    """
+
+    if config is None:
+        config = {}
+    min_percentile = config.get('min_link_weight_percentile', 0)
+    max_percentile = config.get('max_link_weight_percentile', 1)
+    display_singleton_nodes = config.get('display_singleton_nodes', True)
+
+    multigraph = network.is_multigraph()
+
+    if min_percentile <= 0 and max_percentile >= 1 and display_singleton_nodes:
+        if multigraph:
+            nothing = lambda u, v, k: False
+        else:
+            nothing = lambda u, v: False
+        return network, nx.subgraph_view(network, filter_edge=nothing)
+
+    weights = np.fromiter((w for *_, w in network.edges(data='weight', default=1)),
+                          dtype=float, count=network.number_of_edges())
+    low, high = _link_weight_bounds(weights, min_percentile, max_percentile)
+
+    def passes(data):
+        return low <= data.get('weight', 1) <= high
+
+    if multigraph:
+        show_edge = lambda u, v, k: passes(network[u][v][k])
+        withhold_edge = lambda u, v, k: not passes(network[u][v][k])
+    else:
+        show_edge = lambda u, v: passes(network[u][v])
+        withhold_edge = lambda u, v: not passes(network[u][v])
+
+    if display_singleton_nodes:
+        show_node = nx.filters.no_filter
+    else:
+        passing = (weights >= low) & (weights <= high)
+        nodes = { node for edge, keep in zip(network.edges(), passing.tolist()) if keep for node in edge }
+        show_node = nodes.__contains__
+
+    shown = nx.subgraph_view(network, filter_node=show_node, filter_edge=show_edge)
+    withheld = nx.subgraph_view(network, filter_edge=withhold_edge)
+
+    return shown, withheld
+
+def _label_propagation(source, target, weights, N, iterations=10, seed=None):
+    """
+    Partition the nodes with label propagation, where in every iteration
+    a random half of the nodes adopts the label with the largest total
+    link weight among their neighbors. The label weights of all nodes are
+    aggregated at once like the entries of a sparse matrix in COO format.
+    Returns an array of labels in ``range(number_of_labels)``.
+    """
+    rng = np.random.default_rng(seed)
+    labels = np.arange(N)
+    if len(source) == 0:
+        return labels
+
+    # every link counts in both directions
+    nodes = np.concatenate([source, target])
+    neighbors = np.concatenate([target, source])
+    weights = np.concatenate([weights, weights])
+
+    for _ in range(iterations):
+        # keys are sorted by node, then by label
+        keys, inverse = np.unique(nodes * N + labels[neighbors], return_inverse=True)
+        label_weights = np.bincount(inverse.ravel(), weights=weights)
+        node, label = np.divmod(keys, N)
+
+        # for every node, pick the heaviest neighbor label, breaking ties randomly
+        score = label_weights * (1 + 1e-9 * rng.random(len(keys)))
+        starts = np.flatnonzero(np.concatenate([[True], node[1:] != node[:-1]]))
+        maxima = np.repeat(np.maximum.reduceat(score, starts), np.diff(np.append(starts, len(keys))))
+        best = np.flatnonzero(score == maxima)
+        best = best[np.concatenate([[True], node[best][1:] != node[best][:-1]])]
+
+        update = best[rng.random(len(best)) < 0.5]
+        updated = labels.copy()
+        updated[node[update]] = label[update]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+
+    return np.unique(labels, return_inverse=True)[1].ravel()
+
+def _aggregate_links(labels, source, target, weights, K, directed):
+    """
+    Sum the weights of links between (and within) groups, like
+    converting a sparse matrix in COO format to CSR. Returns the
+    groups' links' sources, targets, weights, and the groups'
+    internal weights.
+    """
+    group_source, group_target = labels[source], labels[target]
+    if not directed:
+        group_source, group_target = np.minimum(group_source, group_target), np.maximum(group_source, group_target)
+    internal = group_source == group_target
+    keys, inverse = np.unique(group_source[~internal] * K + group_target[~internal], return_inverse=True)
+    link_weights = np.bincount(inverse.ravel(), weights=weights[~internal], minlength=len(keys))
+    internal_weights = np.bincount(group_source[internal], weights=weights[internal], minlength=K)
+    return keys // K, keys % K, link_weights, internal_weights
+
+def get_coarsened_network(network,
+                          node_group_key='group',
+                          max_supernodes=None,
+                          iterations=10,
+                          seed=None):
+    """
+    Aggregate the nodes of a network into supernodes, either according to
+    their node attribute ``node_group_key`` or, if not every node has this
+    attribute, according to a fast label propagation partition.
+    Links between supernodes carry the summed weight of the links between
+    their members. The aggregation works on sparse link arrays with NumPy,
+    such that it scales to networks with millions of links.
+
+    Parameters
+    ----------
+    network : networkx.Graph or alike
+        The network to coarsen
+    node_group_key : str, default : 'group'
+        Node attribute according to which the nodes are aggregated.
+        If ``None``, the label propagation partition is used.
+    max_supernodes : int, default : None
+        If the label propagation partition results in more supernodes,
+        the supernodes are partitioned again (and so on) until
+        there are at most this many or nothing changes anymore.
+    iterations : int, default : 10
+        Maximum number of label propagation iterations.
+    seed : int, default : None
+        Seed of the label propagation.
+
+    Returns
+    -------
+    coarse : networkx.Graph or networkx.DiGraph
+        The network of supernodes ``0, 1, ...``, each of which has the
+        attributes ``'group'`` (the group it represents), ``'size'``
+        (the number of its members) and ``'internal_weight'``
+        (the summed weight of the links among its members).
+        Links have the attribute ``'weight'``.
+    members : list of list
+        The node ids of the members of every supernode.
+
+    Example
+    -------
+        >>> coarse, members = netwulf.get_coarsened_network(G)
+        >>> subgraph = G.subgraph(members[0])
+    """
+
+    nodes = np.empty(network.number_of_nodes(), dtype=object)
+    nodes[:] = list(network.nodes())
+    N = len(nodes)
+    index = { node: i for i, node in enumerate(nodes.tolist()) }
+    directed = network.is_directed()
+
+    # walk the edges only once
+    M = network.number_of_edges()
+    weights = []
+    def endpoints():
+        for u, v, w in network.edges(data='weight', default=1):
+            weights.append(w)
+            yield index[u]
+            yield index[v]
+    endpoints = np.fromiter(endpoints(), dtype=np.int64, count=2*M).reshape(M, 2)
+    source, target = endpoints[:,0], endpoints[:,1]
+    weights = np.array(weights, dtype=float)
+
+    groups = None
+    if node_group_key is not None:
+        group_data = network.nodes(data=node_group_key)
+        if all(group is not None for _, group in group_data):
+            categories = {}
+            labels = np.fromiter((categories.setdefault(group, len(categories)) for _, group in group_data),
+                                 dtype=np.int64, count=N)
+            groups = list(categories)
+
+    if groups is None:
+        # partition the network and, if necessary, the resulting networks of supernodes
+        labels = np.arange(N)
+        K = N
+        level_source, level_target, level_weights = source, target, weights
+        while True:
+            level_labels = _label_propagation(level_source, level_target, level_weights, K,
+                                              iterations=iterations, seed=seed)
+            labels = level_labels[labels]
+            new_K = level_labels.max() + 1 if K > 0 else 0
+            if max_supernodes is None or new_K <= max_supernodes or new_K == K:
+                break
+            K = new_K
+            level_source, level_target, level_weights, _ = _aggregate_links(labels, source, target, weights, K, directed)
+        groups = list(range(labels.max() + 1 if N > 0 else 0))
+
+    K = len(groups)
+    link_source, link_target, link_weights, internal_weights = \
+            _aggregate_links(labels, source, target, weights, K, directed)
+    sizes = np.bincount(labels, minlength=K)
+
+    coarse = nx.DiGraph() if directed else nx.Graph()
+    coarse.add_nodes_from( (k, {'group': group, 'size': size, 'internal_weight': internal_weight})
+                           for k, (group, size, internal_weight)
+                           in enumerate(zip(groups, sizes.tolist(), internal_weights.tolist())) )
+    coarse.add_weighted_edges_from(zip(link_source.tolist(), link_target.tolist(), link_weights.tolist()))
+
+    order = np.argsort(labels, kind='stable')
+    members = [ m.tolist() for m in np.split(nodes[order], np.cumsum(sizes)[:-1]) ] if N > 0 else []
+
+    return coarse, members
+
+def get_temporal_network(snapshots, times=None):
+    """
+    Combine a sequence of snapshots of a temporal network into the union
+    of their nodes and links and a list of frames, which describe the
+    changes from one snapshot to the next. The union is serialized only
+    once, and the frames refer to its nodes and links by index, such that
+    their size grows with the number of changes instead of with the
+    number of snapshots times the number of links.
+
+    Parameters
+    ----------
+    snapshots : iterable of networkx.Graph or networkx.DiGraph
+        The states of the network at consecutive times. Links are
+        identified by their end points.
+    times : iterable, default : None
+        The times of the snapshots. Defaults to ``0, 1, ...``.
+
+    Returns
+    -------
+    union : networkx.Graph or networkx.DiGraph
+        The network of all nodes and links that appear in any snapshot.
+        Nodes and links carry the attributes of the last snapshot
+        they appear in.
+    frames : list of dict
+        For every snapshot, a dictionary with its ``'time'`` and
+        the indices of the ``'added_nodes'``, ``'removed_nodes'``,
+        ``'added_links'`` and ``'removed_links'`` with respect to the
+        previous snapshot (or to the empty network for the first one),
+        where indices refer to the order of ``union.nodes()``
+        and ``union.edges()``.
+
+    Example
+    -------
+        >>> union, frames = netwulf.get_temporal_network([G0, G1, G2])
+        >>> active_links = set(frames[0]['added_links'])
+    """
+
+    snapshots = list(snapshots)
+    times = list(range(len(snapshots))) if times is None else list(times)
+    if len(times) != len(snapshots):
+        raise ValueError("There must be as many times as snapshots.")
+    directed = any(snapshot.is_directed() for snapshot in snapshots)
+
+    # ids are given in order of appearance and are mapped to the union's order at the end
+    node_ids, link_ids = {}, {}
+    node_data, link_data = [], []
+    deltas = []
+    active_nodes, active_links = set(), set()
+    for snapshot in snapshots:
+        nodes = set()
+        for node, data in snapshot.nodes(data=True):
+            i = node_ids.setdefault(node, len(node_ids))
+            if i == len(node_data):
+                node_data.append(data)
+            else:
+                node_data[i] = data
+            nodes.add(i)
+
+        links = set()
+        for u, v, data in snapshot.edges(data=True):
+            i = link_ids.get((u, v))
+            if i is None and not directed:
+                i = link_ids.get((v, u))
+            if i is None:
+                i = link_ids[(u, v)] = len(link_data)
+                link_data.append(data)
+            else:
+                link_data[i] = data
+            links.add(i)
+
+        deltas.append((nodes - active_nodes, active_nodes - nodes, links - active_links, active_links - links))
+        active_nodes, active_links = nodes, links
+
+    union = nx.DiGraph() if directed else nx.Graph()
+    if len(snapshots) > 0:
+        union.graph.update(snapshots[-1].graph)
+    union.add_nodes_from(zip(node_ids, node_data))
+    union.add_edges_from( (u, v, data) for (u, v), data in zip(link_ids, link_data) )
+
+    node_order = np.empty(len(node_ids), dtype=np.int64)
+    node_order[[ node_ids[node] for node in union.nodes() ]] = np.arange(len(node_ids))
+    link_order = np.empty(len(link_ids), dtype=np.int64)
+    for j, (u, v) in enumerate(union.edges()):
+        i = link_ids.get((u, v))
+        link_order[i if i is not None else link_ids[(v, u)]] = j
+
+    def indices(ids, order):
+        return np.sort(order[np.fromiter(ids, dtype=np.int64, count=len(ids))]).tolist()
+
+    frames = [ {'time': time,
+                'added_nodes': indices(added_nodes, node_order),
+                'removed_nodes': indices(removed_nodes, node_order),
+                'added_links': indices(added_links, link_order),
+                'removed_links': indices(removed_links, link_order),
+               }
+               for time, (added_nodes, removed_nodes, added_links, removed_links) in zip(times, deltas) ]
+
+    return union, frames
+
+def get_filtered_network(network,edge_weight_key=None,node_group_key=None,as_view=False):
     """
     Get a copy of a network where the edge attribute ``'weight'`` is
     set to the attribute given by the keyword ``edge_weight_key`` and the
@@ -266,13 +974,39 @@ def get_filtered_network(network,edge_weight_key=None,node_group_key=None):
     node_group_key : str, default : None
         If provided, set the node ``'group'`` attribute according to a
         new grouping provided by the node attribute ``node_group_key``.
+    as_view : bool, default : False
+        If ``True``, return a read-only view of the original network
+        instead of a copy. The filtered attributes are computed
+        on access, so no part of the network is copied. The view
+        can be passed to :mod:`netwulf.interactive.visualize` and
+        :mod:`netwulf.io.save` directly.
 
     Returns
     -------
     G : networkx.Graph or alike
-        A filtered copy of the original network.
+        A filtered copy (or view) of the original network.
     """
 
+    if node_group_key is not None:
+        groups = { node[1][node_group_key] for node in network.nodes(data=True) }
+        groups_enum = {v: k for k,v in enumerate(groups)}
+
+    if as_view:
+        project_node = None
+        project_edge = None
+
+        if edge_weight_key is not None:
+            def project_edge(d):
+                return {'weight': d[edge_weight_key]}
+
+        if node_group_key is not None:
+            def project_node(d):
+                d = dict(d)
+                d['group'] = groups_enum[d.pop(node_group_key)]
+                return d
+
+        return _filtered_view(network, project_node, project_edge)
+
     G = network.copy()
 
     if edge_weight_key is not None:
@@ -282,8 +1016,6 @@ def get_filtered_network(network,edge_weight_key=None,node_group_key=None):
             G[u][v]['weight'] = keep_value
 
     if node_group_key is not None:
-        groups = { node[1][node_group_key] for node in network.nodes(data=True) }
-        groups_enum = {v: k for k,v in enumerate(groups)}
         for u in network.nodes():
             try:
                 # networkx v < 2.4
@@ -299,7 +1031,7 @@ def get_filtered_network(network,edge_weight_key=None,node_group_key=None):
 
     return G
 
-def draw_netwulf(network_properties, fig=None, ax=None, figsize=None, draw_links=True,draw_nodes=True,link_zorder=-1,node_zorder=1000):
+def draw_netwulf(network_properties, fig=None, ax=None, figsize=None, draw_links=True,draw_nodes=True,link_zorder=-1,node_zorder=1000,rasterize_links=False):
     """
     Redraw the visualization using matplotlib. Creates
     figure and axes if None provided.
@@ -325,6 +1057,10 @@ def draw_netwulf(network_properties, fig=None, ax=None, figsize=None, draw_links
         Whether the links should be drawn
     draw_nodes : bool, default : True
         Whether the nodes should be drawn
+    rasterize_links : bool, default : False
+        Whether the links should be rasterized when saving to
+        vector graphics formats, which keeps PDFs of networks with
+        many links small
     
     Returns
     -------
@@ -373,32 +1109,29 @@ def draw_netwulf(network_properties, fig=None, ax=None, figsize=None, draw_links
 
 
 
-    # filter out node positions for links
+    # node positions in matplotlib data coordinates
     width = network_properties['xlim'][1] - network_properties['xlim'][0]
     height = network_properties['ylim'][1] - network_properties['ylim'][0]
-    pos = { node['id']: np.array([node['x_canvas'], height - node['y_canvas']]) for node in network_properties['nodes'] }
+    nodes = network_properties['nodes']
+    XY = np.array([ [node['x_canvas'], node['y_canvas']] for node in nodes ], dtype=float).reshape(-1, 2)
+    XY[:,1] = height - XY[:,1]
 
     if draw_links:
         #zorder = max( _c.get_zorder() for _c in ax.get_children()) + 1
         zorder = -1 # make sure that links are very much in the background
 
-        lines = []
-        linewidths = []
-        linecolors = []
-        for link in network_properties['links']:
-            u, v = link['source'], link['target']
-            lines.append([ 
-                [pos[u][0], pos[v][0]], 
-                [pos[u][1], pos[v][1]]
-                         ])
-            linewidths.append(link['width']/width*axwidth)
-            if 'color' in link.keys():
-                linecolors.append(link['color'])
-            else:
-                linecolors.append(network_properties['linkColor'])
+        links = network_properties['links']
+        index = { node['id']: i for i, node in enumerate(nodes) }
+        source = np.fromiter((index[link['source']] for link in links), dtype=int, count=len(links))
+        target = np.fromiter((index[link['target']] for link in links), dtype=int, count=len(links))
 
-        # collapse to line segments
-        lines = [list(zip(x, y)) for x, y in lines]
+        # line segments of shape (number of links, 2, 2)
+        lines = np.stack((XY[source], XY[target]), axis=1)
+        linewidths = np.fromiter((link['width'] for link in links), dtype=float, count=len(links)) / width * axwidth
+        if any('color' in link for link in links):
+            linecolors = [ link.get('color', network_properties['linkColor']) for link in links ]
+        else:
+            linecolors = network_properties['linkColor']
 
         # plot Lines
         alpha = network_properties['linkAlpha']
@@ -407,25 +1140,17 @@ def draw_netwulf(network_properties, fig=None, ax=None, figsize=None, draw_links
                                          colors=linecolors,
                                          alpha=alpha, 
                                          linewidths=linewidths,
-                                         zorder=zorder
+                                         zorder=zorder,
+                                         rasterized=rasterize_links,
                                      ))
 
     if draw_nodes:
         zorder = max( _c.get_zorder() for _c in ax.get_children()) + 1
 
-        # compute node positions and properties
-        XY = []
-        size = []
-        node_colors = []
-
-        for node in network_properties['nodes']:
-            XY.append([node['x_canvas'], height - node['y_canvas']])
-            # size has to be given in points*2
-            size.append( 2*node['radius'] )
-            node_colors.append(node['color'])
+        # size has to be given in points*2
+        size = 2*np.fromiter((node['radius'] for node in nodes), dtype=float, count=len(nodes))
+        node_colors = [ node['color'] for node in nodes ]
 
-        XY = np.array(XY)
-        size = np.array(size)
         circles = EllipseCollection(size,size,np.zeros_like(size),
                                     offsets=XY,
                                     units='x',
@@ -22,6 +22,10 @@ setup(
                 'matplotlib>=3.0',
                 'simplejson>=3.0',
             ],
+    extras_require = {
+                'brotli': ['brotli'],
+                'zstd': ['zstandard'],
+            },
     tests_require=['pytest', 'pytest-cov'],
     setup_requires=['pytest-runner'],
     classifiers=['License :: OSI Approved :: MIT License',
@@ -36,6 +40,11 @@ setup(
         'Source': 'https://github.com/benmaier/netwulf/',
         'PyPI': 'https://pypi.org/project/netwulf/',
     },
+    entry_points = {
+                'console_scripts': [
+                    'netwulf = netwulf.cli:main',
+                ],
+            },
     include_package_data = True,
     zip_safe = False,
 )